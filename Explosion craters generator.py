@@ -14,14 +14,326 @@ import bpy
 import bmesh
 import mathutils
 import math
-import random
-from mathutils import Vector, noise
+import functools
+from dataclasses import dataclass, fields, replace
+import numpy as np
 from bpy.types import Operator, Panel, PropertyGroup
 from bpy.props import (
     FloatProperty, IntProperty, BoolProperty, 
-    EnumProperty, PointerProperty
+    EnumProperty, PointerProperty,
+    FloatVectorProperty, IntVectorProperty
 )
 
+# Noise octaves as (scale, weight) pairs
+OUTLINE_OCTAVES = ((2.0, 0.5), (6.0, 0.3), (12.0, 0.2))
+SLOPE_OCTAVES = ((3.0, 0.4), (8.0, 0.3), (1.5, 0.3))
+INNER_OCTAVES = ((1.0, 0.4), (4.0, 0.35), (10.0, 0.25))
+RIM_HEIGHT_OCTAVES = ((1.0, 0.6), (3.5, 0.25), (8.0, 0.15))
+FRAGMENT_OCTAVES = ((6.0, 0.5), (15.0, 0.3), (35.0, 0.2))
+DETAIL_OCTAVES = ((1.0, 0.5), (3.0, 0.3), (8.0, 0.2))
+
+# Rings between the base ring and the closed bottom - 5 gives a smooth slant
+BOTTOM_WALL_RINGS = 5
+
+# Randomized float settings as (property, (min, max) range property on CraterRandomProperties)
+RANDOM_FLOAT_RANGES = (
+    # Basic dimensions with realistic ranges
+    ("outer_radius", "outer_radius_range"),
+    ("inner_radius", "inner_radius_range"),
+    ("depth", "depth_range"),
+    ("rim_height", "rim_height_range"),
+    # Surface noise
+    ("noise_strength", "noise_range"),
+    ("outside_noise_strength", "outside_noise_range"),
+    # Explosion realism features
+    ("blast_asymmetry", "blast_asymmetry_range"),
+    ("edge_fragmentation", "edge_fragmentation_range"),
+    ("crater_outline_irregularity", "outline_irregularity_range"),
+    ("inner_asymmetry", "inner_asymmetry_range"),
+    # Rim features
+    ("rim_height_variation", "rim_variation_range"),
+    ("outer_edge_rounding", "outer_edge_rounding_range"),
+    ("rim_edge_rounding", "rim_edge_rounding_range"),
+    # Wall angles
+    ("outer_wall_angle", "wall_angle_range"),
+    ("inner_wall_angle", "wall_angle_range"),
+)
+
+# Random generator for randomized crater settings
+CRATER_RNG = np.random.default_rng()
+
+# Gradient noise tables: a fixed permutation (doubled to avoid index wrapping)
+# and the 12 cube-edge gradients padded to 16 so a hash can be masked with & 15
+PERLIN_PERMUTATION = np.tile(np.random.default_rng(1337).permutation(256), 2)
+PERLIN_GRADIENTS = np.array([
+    (1, 1, 0), (-1, 1, 0), (1, -1, 0), (-1, -1, 0),
+    (1, 0, 1), (-1, 0, 1), (1, 0, -1), (-1, 0, -1),
+    (0, 1, 1), (0, -1, 1), (0, 1, -1), (0, -1, -1),
+    (1, 1, 0), (0, -1, 1), (-1, 1, 0), (0, -1, -1),
+], dtype=np.float64)
+
+
+def perlin_noise(points):
+    """Vectorized 3D gradient noise for an (N, 3) array of positions, roughly in [-1, 1]"""
+    points = np.asarray(points, dtype=np.float64)
+    cell = np.floor(points)
+    frac = points - cell
+    xi, yi, zi = (cell.astype(np.int64) & 255).T
+    x, y, z = frac.T
+    # Quintic fade curve 6t^5 - 15t^4 + 10t^3
+    u, v, w = (frac * frac * frac * (frac * (frac * 6.0 - 15.0) + 10.0)).T
+    
+    perm = PERLIN_PERMUTATION
+    a = perm[xi] + yi
+    b = perm[xi + 1] + yi
+    aa, ab = perm[a] + zi, perm[a + 1] + zi
+    ba, bb = perm[b] + zi, perm[b + 1] + zi
+    
+    def grad(corner_hash, dx, dy, dz):
+        g = PERLIN_GRADIENTS[corner_hash & 15]
+        return g[:, 0] * dx + g[:, 1] * dy + g[:, 2] * dz
+    
+    def lerp(t, lo, hi):
+        return lo + t * (hi - lo)
+    
+    return lerp(w,
+        lerp(v,
+            lerp(u, grad(perm[aa], x, y, z), grad(perm[ba], x - 1, y, z)),
+            lerp(u, grad(perm[ab], x, y - 1, z), grad(perm[bb], x - 1, y - 1, z))),
+        lerp(v,
+            lerp(u, grad(perm[aa + 1], x, y, z - 1), grad(perm[ba + 1], x - 1, y, z - 1)),
+            lerp(u, grad(perm[ab + 1], x, y - 1, z - 1), grad(perm[bb + 1], x - 1, y - 1, z - 1))))
+
+
+def fractal_perlin(points, octaves):
+    """Sum weighted perlin_noise octaves for an (N, 3) array in a single kernel pass"""
+    points = np.asarray(points, dtype=np.float64)
+    scales = np.array([scale for scale, _ in octaves])
+    weights = np.array([weight for _, weight in octaves])
+    # Stack every octave's samples so the whole fBm is one vectorized evaluation
+    samples = points[np.newaxis, :, :] * scales[:, np.newaxis, np.newaxis]
+    values = perlin_noise(samples.reshape(-1, 3)).reshape(len(octaves), len(points))
+    return weights @ values
+
+
+def ring_faces(current_start, next_start, resolution, triangulate):
+    """(F, 4) quads, or (2F, 3) triangle pairs, bridging two rings of resolution verts"""
+    i = np.arange(resolution)
+    i_next = (i + 1) % resolution
+    a, b = current_start + i, current_start + i_next
+    c, d = next_start + i_next, next_start + i
+    if triangulate:
+        # Game mode emits each quad as two triangles
+        return np.column_stack((a, b, c, a, c, d)).reshape(-1, 3)
+    return np.column_stack((a, b, c, d))
+
+
+def fan_faces(ring_start, resolution, center):
+    """(F, 3) triangles closing a ring onto a single center vertex"""
+    i = np.arange(resolution)
+    return np.column_stack((ring_start + i, ring_start + (i + 1) % resolution, np.full(resolution, center)))
+
+
+@functools.lru_cache(maxsize=64)
+def crater_topology(ring_count, resolution, close_bottom, triangulate):
+    """Face sizes and flat corner vertex indices for a crater of ring_count rings
+    
+    Vertices are laid out ring after ring, followed by the crater center and,
+    with close_bottom, the wall rings and the bottom center. The faces only
+    depend on these counts, so repeated generations reuse the cached
+    (read-only) arrays.
+    """
+    ring_starts = [i * resolution for i in range(ring_count)]
+    crater_center = ring_count * resolution
+    
+    blocks = [
+        ring_faces(current_start, next_start, resolution, triangulate)
+        for current_start, next_start in zip(ring_starts, ring_starts[1:])
+    ]
+    blocks.append(fan_faces(ring_starts[-1], resolution, crater_center))
+    
+    if close_bottom:
+        # Wall rings hang off the base ring, then the bottom is fanned shut
+        wall_start = crater_center + 1
+        wall_starts = [ring_starts[0]] + [wall_start + i * resolution for i in range(BOTTOM_WALL_RINGS)]
+        blocks.extend(
+            ring_faces(current_start, next_start, resolution, triangulate)
+            for current_start, next_start in zip(wall_starts, wall_starts[1:])
+        )
+        blocks.append(fan_faces(wall_starts[-1], resolution, wall_start + BOTTOM_WALL_RINGS * resolution))
+    
+    face_sizes = np.concatenate([np.full(len(block), block.shape[1], dtype=np.int32) for block in blocks])
+    corner_verts = np.concatenate([block.ravel() for block in blocks]).astype(np.int32)
+    face_sizes.flags.writeable = False
+    corner_verts.flags.writeable = False
+    return face_sizes, corner_verts
+
+
+def fill_mesh(mesh, vertices, face_sizes, corner_verts):
+    """Bulk-load an (N, 3) vertex array and flat face arrays into an empty mesh
+    
+    face_sizes holds the corner count of every face and corner_verts the
+    vertex index of every corner, face after face.
+    """
+    loop_starts = np.cumsum(face_sizes, dtype=np.int32) - face_sizes
+    
+    # Each array is written with a single foreach_set per attribute
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set("co", np.asarray(vertices, dtype=np.float32).ravel())
+    mesh.loops.add(len(corner_verts))
+    mesh.loops.foreach_set("vertex_index", corner_verts)
+    # loop_total is derived from consecutive loop_start values
+    mesh.polygons.add(len(face_sizes))
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    mesh.update(calc_edges=True)
+
+
+class CraterRandomProperties(PropertyGroup):
+    """Ranges used by Random Crater and Random Batch, kept apart from the crater settings"""
+    
+    # (min, max) ranges for all parameters with tighter, more reasonable values
+    outer_radius_range: FloatVectorProperty(
+        name="Outer Radius Range",
+        description="Minimum and maximum outer radius for random generation",
+        size=2,
+        default=(2.0, 3.5),
+        min=0.1,
+        max=200.0,
+        unit='LENGTH'
+    )
+    
+    inner_radius_range: FloatVectorProperty(
+        name="Inner Radius Range",
+        description="Minimum and maximum inner radius for random generation",
+        size=2,
+        default=(1.0, 1.8),
+        min=0.1,
+        max=200.0,
+        unit='LENGTH'
+    )
+    
+    depth_range: FloatVectorProperty(
+        name="Depth Range",
+        description="Minimum and maximum depth for random generation",
+        size=2,
+        default=(0.3, 0.8),
+        min=0.1,
+        max=100.0,
+        unit='LENGTH'
+    )
+    
+    rim_height_range: FloatVectorProperty(
+        name="Rim Height Range",
+        description="Minimum and maximum rim height for random generation",
+        size=2,
+        default=(0.3, 0.9),
+        min=0.0,
+        max=100.0,
+        unit='LENGTH'
+    )
+    
+    resolution_range: IntVectorProperty(
+        name="Resolution Range",
+        description="Minimum and maximum resolution for random generation",
+        size=2,
+        default=(20, 32),
+        min=8,
+        max=500
+    )
+    
+    noise_range: FloatVectorProperty(
+        name="Inside Noise Range",
+        description="Minimum and maximum inside noise for random generation",
+        size=2,
+        default=(0.02, 0.1),
+        min=0.0,
+        max=30.0
+    )
+    
+    outside_noise_range: FloatVectorProperty(
+        name="Outside Noise Range",
+        description="Minimum and maximum outside noise for random generation",
+        size=2,
+        default=(0.01, 0.05),
+        min=0.0,
+        max=30.0
+    )
+    
+    # Random ranges for explosion realism - tighter ranges
+    blast_asymmetry_range: FloatVectorProperty(
+        name="Blast Asymmetry Range",
+        description="Minimum and maximum blast asymmetry for random generation",
+        size=2,
+        default=(0.0, 0.2),
+        min=0.0,
+        max=1.0
+    )
+    
+    edge_fragmentation_range: FloatVectorProperty(
+        name="Edge Fragmentation Range",
+        description="Minimum and maximum edge fragmentation for random generation",
+        size=2,
+        default=(0.0, 8.0),
+        min=0.0,
+        max=100.0
+    )
+    
+    rim_variation_range: FloatVectorProperty(
+        name="Rim Variation Range",
+        description="Minimum and maximum rim variation for random generation",
+        size=2,
+        default=(0.0, 0.15),
+        min=0.0,
+        max=1.0
+    )
+    
+    outline_irregularity_range: FloatVectorProperty(
+        name="Outline Irregularity Range",
+        description="Minimum and maximum outline irregularity for random generation",
+        size=2,
+        default=(0.0, 5.0),
+        min=0.0,
+        max=50.0
+    )
+    
+    inner_asymmetry_range: FloatVectorProperty(
+        name="Inner Asymmetry Range",
+        description="Minimum and maximum inner asymmetry for random generation",
+        size=2,
+        default=(0.0, 0.15),
+        min=0.0,
+        max=1.0
+    )
+    
+    outer_edge_rounding_range: FloatVectorProperty(
+        name="Outer Edge Rounding Range",
+        description="Minimum and maximum outer edge rounding for random generation",
+        size=2,
+        default=(0.0, 0.25),
+        min=0.0,
+        max=1.0
+    )
+    
+    rim_edge_rounding_range: FloatVectorProperty(
+        name="Rim Edge Rounding Range",
+        description="Minimum and maximum rim edge rounding for random generation",
+        size=2,
+        default=(0.0, 0.2),
+        min=0.0,
+        max=1.0
+    )
+    
+    wall_angle_range: FloatVectorProperty(
+        name="Wall Angle Range",
+        description="Minimum and maximum wall angle for random generation",
+        size=2,
+        default=(-10.0, 10.0),
+        min=-89.0,
+        max=89.0,
+        unit='ROTATION'
+    )
+
+
 class CraterProperties(PropertyGroup):
     """Properties for crater generation based on real crater analysis"""
     
@@ -132,6 +444,13 @@ class CraterProperties(PropertyGroup):
         step=10
     )
     
+    random_seed: IntProperty(
+        name="Random Seed",
+        description="Seed for the blast and inner asymmetry directions (0 = new random directions each time)",
+        default=0,
+        min=0
+    )
+    
     bottom_thickness: FloatProperty(
         name="Bottom Thickness",
         description="Thickness of the crater bottom (how deep below ground level)",
@@ -233,301 +552,196 @@ class CraterProperties(PropertyGroup):
         max=10.0
     )
     
-    # Random range controls for all parameters with tighter, more reasonable ranges
-    random_outer_radius_min: FloatProperty(
-        name="Random Outer Radius Min",
-        description="Minimum outer radius for random generation",
-        default=2.0,
-        min=0.1,
-        max=99.0,
-        unit='LENGTH'
-    )
-    
-    random_outer_radius_max: FloatProperty(
-        name="Random Outer Radius Max", 
-        description="Maximum outer radius for random generation",
-        default=3.5,
-        min=1.0,
-        max=200.0,
-        unit='LENGTH'
-    )
-    
-    random_inner_radius_min: FloatProperty(
-        name="Random Inner Radius Min",
-        description="Minimum inner radius for random generation",
-        default=1.0,
-        min=0.1,
-        max=99.0,
-        unit='LENGTH'
-    )
-    
-    random_inner_radius_max: FloatProperty(
-        name="Random Inner Radius Max", 
-        description="Maximum inner radius for random generation",
-        default=1.8,
-        min=1.0,
-        max=200.0,
-        unit='LENGTH'
-    )
-    
-    random_depth_min: FloatProperty(
-        name="Random Depth Min",
-        default=0.3, min=0.1, max=99.0, unit='LENGTH'
-    )
-    random_depth_max: FloatProperty(
-        name="Random Depth Max", 
-        default=0.8, min=1.0, max=100.0, unit='LENGTH'
-    )
-    
-    random_rim_height_min: FloatProperty(
-        name="Random Rim Height Min",
-        default=0.3, min=0.0, max=99.0, unit='LENGTH'
-    )
-    random_rim_height_max: FloatProperty(
-        name="Random Rim Height Max",
-        default=0.9, min=1.0, max=100.0, unit='LENGTH'
-    )
-    
-    random_resolution_min: IntProperty(
-        name="Random Resolution Min",
-        default=20, min=8, max=499
-    )
-    random_resolution_max: IntProperty(
-        name="Random Resolution Max",
-        default=32, min=9, max=500
-    )
-    
-    random_noise_min: FloatProperty(
-        name="Random Noise Min",
-        default=0.02, min=0.0, max=29.9
-    )
-    random_noise_max: FloatProperty(
-        name="Random Noise Max",
-        default=0.1, min=0.01, max=30.0
-    )
-    
-    random_outside_noise_min: FloatProperty(
-        name="Random Outside Noise Min",
-        default=0.01, min=0.0, max=29.9
-    )
-    random_outside_noise_max: FloatProperty(
-        name="Random Outside Noise Max",
-        default=0.05, min=0.01, max=30.0
-    )
-    
-    # Random ranges for explosion realism - tighter ranges
-    random_blast_asymmetry_min: FloatProperty(
-        name="Random Blast Asymmetry Min",
-        default=0.0, min=0.0, max=0.99
-    )
-    random_blast_asymmetry_max: FloatProperty(
-        name="Random Blast Asymmetry Max",
-        default=0.2, min=0.01, max=1.0
-    )
-    
-    random_edge_fragmentation_min: FloatProperty(
-        name="Random Edge Fragmentation Min", 
-        default=0.0, min=0.0, max=99.9
-    )
-    random_edge_fragmentation_max: FloatProperty(
-        name="Random Edge Fragmentation Max",
-        default=8.0, min=0.01, max=100.0
-    )
-    
-    random_rim_variation_min: FloatProperty(
-        name="Random Rim Variation Min",
-        default=0.0, min=0.0, max=0.99
-    )
-    random_rim_variation_max: FloatProperty(
-        name="Random Rim Variation Max",
-        default=0.15, min=0.01, max=1.0
-    )
+    # Random generation ranges, only read by the random crater operators
+    random: PointerProperty(type=CraterRandomProperties)
     
-    random_outline_irregularity_min: FloatProperty(
-        name="Random Outline Irregularity Min",
-        default=0.0, min=0.0, max=49.9
-    )
-    random_outline_irregularity_max: FloatProperty(
-        name="Random Outline Irregularity Max",
-        default=5.0, min=0.1, max=50.0
-    )
-    
-    random_inner_asymmetry_min: FloatProperty(
-        name="Random Inner Asymmetry Min",
-        default=0.0, min=0.0, max=0.99
-    )
-    random_inner_asymmetry_max: FloatProperty(
-        name="Random Inner Asymmetry Max",
-        default=0.15, min=0.01, max=1.0
-    )
-    
-    random_outer_edge_rounding_min: FloatProperty(
-        name="Random Outer Edge Rounding Min",
-        default=0.0, min=0.0, max=0.99
-    )
-    random_outer_edge_rounding_max: FloatProperty(
-        name="Random Outer Edge Rounding Max",
-        default=0.25, min=0.01, max=1.0
-    )
-    
-    random_rim_edge_rounding_min: FloatProperty(
-        name="Random Rim Edge Rounding Min",
-        default=0.0, min=0.0, max=0.99
-    )
-    random_rim_edge_rounding_max: FloatProperty(
-        name="Random Rim Edge Rounding Max",
-        default=0.2, min=0.01, max=1.0
-    )
-    
-    random_wall_angle_min: FloatProperty(
-        name="Random Wall Angle Min",
-        default=-10.0, min=-89.0, max=88.0, unit='ROTATION'
-    )
-    random_wall_angle_max: FloatProperty(
-        name="Random Wall Angle Max",
-        default=10.0, min=-88.0, max=89.0, unit='ROTATION'
+    # Panel display state
+    show_random_ranges: BoolProperty(
+        name="Random Generation Ranges",
+        description="Show the ranges used by Random Crater and Random Batch",
+        default=False
     )
 
 
-class MESH_OT_add_crater(Operator):
-    """Generate clean game-ready crater mesh based on real crater analysis"""
-    bl_idname = "mesh.add_crater"
-    bl_label = "Add Game Crater"
-    bl_options = {'REGISTER', 'UNDO', 'PRESET'}
-    
-    # Operator properties for undo panel - MUST MATCH PropertyGroup names exactly
-    outer_radius: FloatProperty(name="Outer Radius", default=2.6, min=0.5, max=100.0)
-    inner_radius: FloatProperty(name="Inner Radius", default=1.3, min=0.1, max=50.0)
-    depth: FloatProperty(name="Depth", default=0.5, min=0.1, max=100.0)
-    rim_height: FloatProperty(name="Rim Height", default=0.58, min=0.0, max=100.0)
-    resolution: IntProperty(name="Resolution", default=24, min=8, max=500)
-    noise_strength: FloatProperty(name="Inside Noise", default=0.0, min=0.0, max=30.0)
-    outside_noise_strength: FloatProperty(name="Outside Noise", default=0.0, min=0.0, max=30.0)
-    create_materials: BoolProperty(name="Materials", default=True)
-    auto_uv: BoolProperty(name="Auto UV", default=True)
-    optimize_for_games: BoolProperty(name="Game Optimization", default=True)
-    close_bottom: BoolProperty(name="Close Bottom", default=True)
-    center_origin: BoolProperty(name="Center Origin", default=False)
-    bottom_thickness: FloatProperty(name="Bottom Thickness", default=1.0, min=0.1, max=10.0)
-    outer_wall_angle: FloatProperty(name="Outer Wall Angle", default=0.0, min=-89.0, max=89.0)
-    inner_wall_angle: FloatProperty(name="Inner Wall Angle", default=0.0, min=-89.0, max=89.0)
-    rim_height_variation: FloatProperty(name="Rim Variation", default=0.0, min=0.0, max=1.0)
-    rim_noise_scale: FloatProperty(name="Rim Noise Scale", default=3.0, min=0.5, max=10.0)
-    blast_asymmetry: FloatProperty(name="Blast Asymmetry", default=0.0, min=0.0, max=1.0)
-    edge_fragmentation: FloatProperty(name="Edge Fragmentation", default=0.0, min=0.0, max=100.0)
-    inner_asymmetry: FloatProperty(name="Inner Asymmetry", default=0.0, min=0.0, max=1.0)
-    crater_outline_irregularity: FloatProperty(name="Crater Outline Irregularity", default=0.0, min=0.0, max=50.0)
-    rim_edge_rounding: FloatProperty(name="Rim Edge Rounding", default=0.0, min=0.0, max=1.0)
-    outer_edge_rounding: FloatProperty(name="Outer Edge Rounding", default=0.0, min=0.0, max=1.0)
-    center_origin_z_offset: FloatProperty(name="Center Origin Z Offset", default=0.0, min=-10.0, max=10.0)
-    
-    def execute(self, context):
-        try:
-            # Generate clean crater mesh
+@dataclass(frozen=True, slots=True)
+class CraterParams:
+    """Plain snapshot of the crater settings used while building one crater"""
+    outer_radius: float
+    inner_radius: float
+    depth: float
+    rim_height: float
+    resolution: int
+    noise_strength: float
+    outside_noise_strength: float
+    create_materials: bool
+    auto_uv: bool
+    optimize_for_games: bool
+    close_bottom: bool
+    center_origin: bool
+    bottom_thickness: float
+    outer_wall_angle: float
+    inner_wall_angle: float
+    rim_height_variation: float
+    rim_noise_scale: float
+    blast_asymmetry: float
+    edge_fragmentation: float
+    inner_asymmetry: float
+    crater_outline_irregularity: float
+    rim_edge_rounding: float
+    outer_edge_rounding: float
+    center_origin_z_offset: float
+    random_seed: int
+    
+    @classmethod
+    def from_settings(cls, settings):
+        """Read every crater setting once from an operator or CraterProperties"""
+        return cls(**{field.name: getattr(settings, field.name) for field in fields(cls)})
+
+
+# Settings shared by CraterProperties and MESH_OT_add_crater
+CRATER_SETTING_NAMES = tuple(field.name for field in fields(CraterParams))
+
+
+class CraterBuilder:
+    """Builds crater objects from a CraterParams snapshot
+    
+    Settings are read through plain attribute access, so the generation
+    methods can use self.outer_radius etc. directly.
+    """
+    
+    def __init__(self, settings):
+        self.settings = settings
+    
+    def __getattr__(self, name):
+        return getattr(self.settings, name)
+    
+    def build(self, context, select=True):
+        """Generate the crater mesh, finish it and link it to the scene; returns the object
+        
+        With select=False the selection and active object are left alone, so
+        batches can select their craters once at the end.
+        """
+        # Generate clean crater mesh; seeded craters always come out the same,
+        # so redo-panel reruns with unchanged geometry reuse the cached arrays.
+        # Settings only read by the later passes are reset in the cache key
+        if self.random_seed:
+            geometry_params = replace(
+                self.settings,
+                create_materials=False,
+                auto_uv=False,
+                center_origin=False,
+                center_origin_z_offset=0.0,
+            )
+            crater_data = seeded_crater_data(geometry_params)
+        else:
             crater_data = self.generate_clean_crater()
-            if not crater_data:
-                self.report({'ERROR'}, "Failed to generate crater mesh")
-                return {'CANCELLED'}
-            
-            # Create mesh object
-            mesh = bpy.data.meshes.new("GameCrater")
-            obj = bpy.data.objects.new("GameCrater", mesh)
-            
-            # Calculate origin position with Z offset
-            if self.center_origin:
-                # Place origin at the underside/bottom of the crater with additional offset
-                origin_z = -self.depth + self.center_origin_z_offset  # Bottom of crater + user offset
-                obj.location = (
-                    context.scene.cursor.location.x,
-                    context.scene.cursor.location.y,
-                    context.scene.cursor.location.z + origin_z
-                )
-                # Offset all mesh vertices to compensate for the new origin
-                mesh_offset_z = -origin_z  # Inverse of the origin offset
-                for i, vert in enumerate(crater_data['vertices']):
-                    crater_data['vertices'][i] = [vert[0], vert[1], vert[2] + mesh_offset_z]
-            else:
-                # Standard behavior - origin at ground level
-                obj.location = context.scene.cursor.location
-            
-            # Apply mesh data
-            mesh.from_pydata(crater_data['vertices'], [], crater_data['faces'])
+        vertices = crater_data['vertices']
+        
+        # Create mesh object
+        mesh = bpy.data.meshes.new("GameCrater")
+        obj = bpy.data.objects.new("GameCrater", mesh)
+        
+        # Calculate origin position with Z offset
+        if self.center_origin:
+            # Place origin at the underside/bottom of the crater with additional offset
+            origin_z = -self.depth + self.center_origin_z_offset  # Bottom of crater + user offset
+            obj.location = (
+                context.scene.cursor.location.x,
+                context.scene.cursor.location.y,
+                context.scene.cursor.location.z + origin_z
+            )
+            # Offset all mesh vertices to compensate for the new origin
+            mesh_offset_z = -origin_z  # Inverse of the origin offset
+            vertices = vertices + (0.0, 0.0, mesh_offset_z)
+        else:
+            # Standard behavior - origin at ground level
+            obj.location = context.scene.cursor.location
+        
+        # Apply mesh data
+        fill_mesh(mesh, vertices, crater_data['face_sizes'], crater_data['corner_verts'])
+        
+        # UVs follow the generated vertex layout, so they go on before the
+        # topology cleanup merges vertices; bmesh carries them through it
+        if self.auto_uv:
+            self.generate_crater_uvs(obj)
+        
+        # Apply game optimizations
+        if self.optimize_for_games:
+            # Topology cleanup is the only step that needs bmesh
+            bm = bmesh.new()
+            try:
+                bm.from_mesh(mesh)
+                self.optimize_crater_topology(bm)
+                bm.to_mesh(mesh)
+            finally:
+                bm.free()
+            self.optimize_mesh_for_games(mesh)
+        
+        # Apply materials - like the UV pass this writes straight to the mesh
+        # data, so a single update covers both
+        if self.create_materials:
+            self.setup_clean_materials(obj)
+        if self.create_materials or self.auto_uv:
             mesh.update()
-            
-            # Apply game optimizations
-            if self.optimize_for_games:
-                self.optimize_mesh_for_games(mesh)
-            
-            # Link to scene and select
-            context.collection.objects.link(obj)
-            bpy.ops.object.select_all(action='DESELECT')
+        
+        # Link the finished object to the scene and select it
+        context.collection.objects.link(obj)
+        if select:
+            for selected in context.selected_objects:
+                selected.select_set(False)
             obj.select_set(True)
             context.view_layer.objects.active = obj
-            
-            # Apply materials and UVs
-            if self.create_materials:
-                self.setup_clean_materials(obj)
-            if self.auto_uv:
-                self.generate_crater_uvs(obj)
-            
-            # Report results
-            tri_count = len(mesh.polygons)
-            vertex_count = len(mesh.vertices)
-            
-            origin_info = "at crater bottom" if self.center_origin else "at ground level"
-            self.report({'INFO'}, f"Crater: {tri_count} triangles, {vertex_count} vertices, origin {origin_info}")
-            
-            return {'FINISHED'}
-            
-        except Exception as e:
-            self.report({'ERROR'}, f"Crater generation failed: {str(e)}")
-            return {'CANCELLED'}
+        
+        return obj
     
     def generate_clean_crater(self):
         """Generate clean crater based on analysis data"""
-        bm = bmesh.new()
+        # Generate clean base geometry as vertex and face index arrays
+        vertices, face_sizes, corner_verts = self.create_clean_crater_geometry()
         
-        try:
-            # Generate clean base geometry
-            self.create_clean_crater_geometry(bm)
-            
-            # Add minimal surface detail
-            self.apply_minimal_detail(bm)
-            
-            # Optimize topology
-            if self.optimize_for_games:
-                self.optimize_crater_topology(bm)
-            
-            # Extract mesh data
-            vertices = [[v.co.x, v.co.y, v.co.z] for v in bm.verts]
-            faces = [[v.index for v in f.verts] for f in bm.faces]
-            
-            return {'vertices': vertices, 'faces': faces}
-            
-        finally:
-            bm.free()
+        # Add minimal surface detail
+        self.apply_minimal_detail(vertices)
+        
+        return {'vertices': vertices, 'face_sizes': face_sizes, 'corner_verts': corner_verts}
     
-    def create_clean_crater_geometry(self, bm):
-        """Create clean crater geometry based on real crater analysis"""
+    def create_clean_crater_geometry(self):
+        """Create clean crater geometry based on real crater analysis
+        
+        Returns an (N, 3) vertex array plus the face_sizes and corner_verts
+        arrays for fill_mesh().
+        Each ring's coordinates are kept as one array block in ring_coords and
+        the ring itself is tracked as the range of vertex indices it occupies.
+        """
+        ring_coords = []
         all_ring_verts = []
         
         # Use new dual radius system
         base_radius = self.outer_radius
         rim_radius = self.inner_radius
         
-        # Calculate random asymmetry direction if asymmetric
-        if self.blast_asymmetry > 0:
-            blast_angle_rad = random.uniform(0, 2 * math.pi)  # Random direction each time
-        else:
-            blast_angle_rad = 0.0
+        # Draw the blast and inner asymmetry directions together; a seed of 0
+        # gives new random directions each time, any other seed repeats them
+        rng = np.random.default_rng(self.random_seed or None)
+        blast_angle_rad, inner_asymmetry_angle = rng.uniform(0.0, 2 * math.pi, size=2)
+        
+        # Angle tables shared by every ring
+        resolution = self.resolution
+        angles = np.linspace(0.0, 2 * math.pi, resolution, endpoint=False)
+        cos_a = np.cos(angles)
+        sin_a = np.sin(angles)
+        # Unit circle in the XY plane; ring noise samples offset it along Z
+        unit_circle = np.column_stack((cos_a, sin_a, np.zeros(resolution)))
+        # Blast asymmetry scaled by how aligned each point is with the blast direction
+        # (-1 to 1, where 1 is perfectly aligned); each ring only applies its own weight
+        blast_push = self.blast_asymmetry * np.cos(angles - blast_angle_rad)
         
         # Create outer ground-level base ring with outline irregularity and outer edge rounding
         all_ring_verts = []
         
         # Improved outer edge rounding with better geometry and scaling
         if self.outer_edge_rounding > 0:
-            # Create more rings for smoother transitions
-            outer_rings = max(3, int(self.outer_edge_rounding * 5 + 3))
+            # Create more rings for smoother transitions (game mode keeps the minimum)
+            outer_rings = 3 if self.optimize_for_games else max(3, int(self.outer_edge_rounding * 5 + 3))
             extended_radius = base_radius * (1.0 + self.outer_edge_rounding * 0.8)  # More extension
             
             for outer_ring in range(outer_rings):
@@ -540,75 +754,31 @@ class MESH_OT_add_crater(Operator):
                 height_curve = 1.0 - ring_factor
                 ring_height = -self.outer_edge_rounding * 0.25 * (1.0 - height_curve ** 1.8)
                 
-                ring_verts = []
-                for i in range(self.resolution):
-                    angle = 2 * math.pi * i / self.resolution
-                    
-                    # Apply blast asymmetry to outer rings with falloff
-                    point_direction = angle - blast_angle_rad
-                    alignment = math.cos(point_direction)
-                    asymmetry_strength = 2.5 * (1.0 - ring_factor * 0.7)  # Reduce with distance
-                    asymmetry_factor = 1.0 + self.blast_asymmetry * alignment * asymmetry_strength
-                    
-                    # Apply crater outline irregularity to outer rings with falloff
-                    irregularity_factor = 1.0
-                    if self.crater_outline_irregularity > 0:
-                        noise_pos = Vector((math.cos(angle), math.sin(angle), ring_factor))
-                        outline_noise = (
-                            noise.noise(noise_pos * 2.0) * 0.5 +
-                            noise.noise(noise_pos * 6.0) * 0.3 +
-                            noise.noise(noise_pos * 12.0) * 0.2
-                        )
-                        irregularity_strength = 0.8 * (1.0 - ring_factor * 0.6)  # Reduce with distance
-                        irregularity_factor = 1.0 + outline_noise * (self.crater_outline_irregularity / 50.0) * irregularity_strength
-                    
-                    combined_factor = asymmetry_factor * irregularity_factor
-                    
-                    x = ring_radius * math.cos(angle) * combined_factor
-                    y = ring_radius * math.sin(angle) * combined_factor
-                    z = ring_height
-                    
-                    ring_verts.append(bm.verts.new((x, y, z)))
-                all_ring_verts.append(ring_verts)
+                # Apply blast asymmetry to outer rings with falloff
+                asymmetry_strength = 2.5 * (1.0 - ring_factor * 0.7)  # Reduce with distance
+                # Apply crater outline irregularity to outer rings with falloff
+                irregularity_strength = 0.8 * (1.0 - ring_factor * 0.6)  # Reduce with distance
+                combined_factor = (1.0 + blast_push * asymmetry_strength) * self.outline_factor(
+                    unit_circle, ring_factor, irregularity_strength
+                )
+                
+                all_ring_verts.append(
+                    self.create_circle_ring(ring_coords, unit_circle, ring_radius, combined_factor, ring_height)
+                )
         
         # Create main base ring
-        base_verts = []
-        for i in range(self.resolution):
-            angle = 2 * math.pi * i / self.resolution
-            
-            # Apply blast asymmetry - crater extends further in blast direction
-            # Calculate how aligned this point is with the blast direction
-            point_direction = angle - blast_angle_rad
-            alignment = math.cos(point_direction)  # -1 to 1, where 1 is perfectly aligned
-            
-            # Improved asymmetry with more realistic scaling
-            asymmetry_factor = 1.0 + self.blast_asymmetry * alignment * 2.5  # Increased impact
-            
-            # Apply crater outline irregularity with improved noise function
-            irregularity_factor = 1.0
-            if self.crater_outline_irregularity > 0:
-                # Use multiple noise octaves for more natural variation
-                noise_pos = Vector((math.cos(angle), math.sin(angle), 0))
-                outline_noise = (
-                    noise.noise(noise_pos * 2.0) * 0.5 +      # Large-scale variation
-                    noise.noise(noise_pos * 6.0) * 0.3 +      # Medium detail
-                    noise.noise(noise_pos * 12.0) * 0.2       # Fine detail
-                )
-                # More aggressive scaling for visible effect (adjusted for 0-50 range)
-                irregularity_factor = 1.0 + outline_noise * (self.crater_outline_irregularity / 50.0) * 0.8
-            
-            # Combine asymmetry and irregularity
-            combined_factor = asymmetry_factor * irregularity_factor
-            
-            x = base_radius * math.cos(angle) * combined_factor
-            y = base_radius * math.sin(angle) * combined_factor
-            z = 0.0  # Ground level
-            
-            base_verts.append(bm.verts.new((x, y, z)))
-        all_ring_verts.append(base_verts)
+        # Apply blast asymmetry - crater extends further in blast direction (increased impact)
+        # and crater outline irregularity with more aggressive scaling for visible effect
+        combined_factor = (1.0 + blast_push * 2.5) * self.outline_factor(unit_circle, 0.0, 0.8)
+        all_ring_verts.append(
+            self.create_circle_ring(ring_coords, unit_circle, base_radius, combined_factor, 0.0)  # Ground level
+        )
         
-        # Create slope rings - minimal for clean geometry
-        slope_rings = max(2, min(3, self.resolution // 16))
+        # Create slope rings - minimal for clean geometry, and fixed at the minimum for games
+        slope_rings = 2 if self.optimize_for_games else max(2, min(3, self.resolution // 16))
+        
+        # Apply blast asymmetry to slope rings too
+        slope_asymmetry = 1.0 + blast_push * 0.8  # Increased from 0.3 to 0.8
         
         for slope_ring in range(1, slope_rings + 1):
             ring_factor = slope_ring / slope_rings
@@ -618,42 +788,23 @@ class MESH_OT_add_crater(Operator):
             # Gentle slope rise (24° average from analysis)
             slope_height = self.rim_height * (ring_factor ** 0.8)
             
-            ring_verts = []
-            for i in range(self.resolution):
-                angle = 2 * math.pi * i / self.resolution
-                
-                # Apply blast asymmetry to slope rings too
-                point_direction = angle - blast_angle_rad
-                alignment = math.cos(point_direction)
-                asymmetry_factor = 1.0 + self.blast_asymmetry * alignment * 0.8  # Increased from 0.3 to 0.8
-                
-                # Apply crater outline irregularity to slope rings
-                irregularity_factor = 1.0
-                if self.crater_outline_irregularity > 0:
-                    noise_pos = Vector((math.cos(angle), math.sin(angle), ring_factor)) * 2.0
-                    outline_noise = (
-                        noise.noise(noise_pos * 3.0) * 0.4 +
-                        noise.noise(noise_pos * 8.0) * 0.3 +
-                        noise.noise(noise_pos * 1.5) * 0.3
-                    )
-                    irregularity_factor = 1.0 + outline_noise * (self.crater_outline_irregularity / 50.0) * 0.3
-                
-                combined_factor = asymmetry_factor * irregularity_factor
-                
-                x = ring_radius * math.cos(angle) * combined_factor
-                y = ring_radius * math.sin(angle) * combined_factor
-                z = slope_height
-                
-                ring_verts.append(bm.verts.new((x, y, z)))
-            all_ring_verts.append(ring_verts)
+            # Apply crater outline irregularity to slope rings
+            combined_factor = slope_asymmetry * self.outline_factor(
+                unit_circle, ring_factor, 0.3, SLOPE_OCTAVES, noise_scale=2.0
+            )
+            
+            all_ring_verts.append(
+                self.create_circle_ring(ring_coords, unit_circle, ring_radius, combined_factor, slope_height)
+            )
         
         # Create crater rim with improved variation and fragmentation
-        rim_verts = []
+        # Apply blast asymmetry to rim
+        rim_asymmetry = 1.0 + blast_push * 0.6
         
         # Add extra rim rings for top edge rounding if enabled
         if self.rim_edge_rounding > 0:
-            # Create additional rings above the main rim for smooth top edge
-            rim_rings = max(2, int(self.rim_edge_rounding * 3 + 2))
+            # Create additional rings above the main rim for smooth top edge (game mode keeps the minimum)
+            rim_rings = 2 if self.optimize_for_games else max(2, int(self.rim_edge_rounding * 3 + 2))
             
             for rim_ring in range(rim_rings):
                 ring_factor = rim_ring / rim_rings
@@ -662,119 +813,70 @@ class MESH_OT_add_crater(Operator):
                 # Smooth height transition downward from peak
                 height_factor = 1.0 - (ring_factor ** (2.0 - self.rim_edge_rounding * 0.8)) * self.rim_edge_rounding * 0.3
                 
-                ring_verts = []
-                for i in range(self.resolution):
-                    angle = 2 * math.pi * i / self.resolution
-                    
-                    # Apply blast asymmetry to rim rings
-                    point_direction = angle - blast_angle_rad
-                    alignment = math.cos(point_direction)
-                    asymmetry_factor = 1.0 + self.blast_asymmetry * alignment * 0.6
-                    
-                    # Apply crater outline irregularity to rim rings
-                    irregularity_factor = 1.0
-                    if self.crater_outline_irregularity > 0:
-                        noise_pos = Vector((math.cos(angle), math.sin(angle), ring_factor))
-                        outline_noise = (
-                            noise.noise(noise_pos * 2.0) * 0.5 +
-                            noise.noise(noise_pos * 6.0) * 0.3 +
-                            noise.noise(noise_pos * 12.0) * 0.2
-                        )
-                        irregularity_factor = 1.0 + outline_noise * (self.crater_outline_irregularity / 50.0) * 0.25
-                    
-                    combined_factor = asymmetry_factor * irregularity_factor * radius_factor
-                    
-                    x = rim_radius * math.cos(angle) * combined_factor
-                    y = rim_radius * math.sin(angle) * combined_factor
-                    
-                    # Calculate height with rim edge rounding affecting the top
-                    base_height = self.rim_height * height_factor
-                    
-                    ring_verts.append(bm.verts.new((x, y, base_height)))
-                all_ring_verts.append(ring_verts)
-        
-        # Create main rim ring
-        for i in range(self.resolution):
-            angle = 2 * math.pi * i / self.resolution
-            
-            # Apply blast asymmetry to rim
-            point_direction = angle - blast_angle_rad
-            alignment = math.cos(point_direction)
-            asymmetry_factor = 1.0 + self.blast_asymmetry * alignment * 0.6
-            
-            # Apply crater outline irregularity to rim
-            irregularity_factor = 1.0
-            if self.crater_outline_irregularity > 0:
-                noise_pos = Vector((math.cos(angle), math.sin(angle), 1.0))
-                outline_noise = (
-                    noise.noise(noise_pos * 2.0) * 0.5 +
-                    noise.noise(noise_pos * 6.0) * 0.3 +
-                    noise.noise(noise_pos * 12.0) * 0.2
-                )
-                irregularity_factor = 1.0 + outline_noise * (self.crater_outline_irregularity / 50.0) * 0.25
-            
-            combined_factor = asymmetry_factor * irregularity_factor
-            
-            x = rim_radius * math.cos(angle) * combined_factor
-            y = rim_radius * math.sin(angle) * combined_factor
-            
-            # Completely rebuilt rim height variation with much better noise
-            height_variation = 0.0
-            if self.rim_height_variation > 0:
-                # Use multiple noise layers for realistic geological variation
-                height_pos = Vector((x, y, 0)) * (self.rim_noise_scale * 0.03)  # Better base scaling
-                height_noise = (
-                    noise.noise(height_pos * 1.0) * 0.6 +     # Large geological features
-                    noise.noise(height_pos * 3.5) * 0.25 +   # Medium undulation
-                    noise.noise(height_pos * 8.0) * 0.15     # Fine surface detail
-                )
-                # Much more dramatic and realistic height variation
-                height_variation = height_noise * self.rim_height_variation * self.rim_height * 2.0
-            
-            # Completely rebuilt edge fragmentation with realistic crater damage
-            fragmentation_factor = 1.0
-            if self.edge_fragmentation > 0:
-                # Multiple fragmentation patterns for realistic explosive damage
-                frag_pos = Vector((x, y, 0)) * 0.008  # Fine-tuned scale
-                
-                # Large blast chunks
-                large_chunks = noise.noise(frag_pos * 6.0) * 0.5
-                # Medium debris patterns  
-                medium_chunks = noise.noise(frag_pos * 15.0) * 0.3
-                # Fine fragmentation detail
-                fine_detail = noise.noise(frag_pos * 35.0) * 0.2
+                # Apply crater outline irregularity to rim rings
+                combined_factor = rim_asymmetry * radius_factor * self.outline_factor(unit_circle, ring_factor, 0.25)
                 
-                frag_noise = large_chunks + medium_chunks + fine_detail
+                # Calculate height with rim edge rounding affecting the top
+                base_height = self.rim_height * height_factor
                 
-                # Improved fragmentation with realistic damage patterns
-                frag_intensity = self.edge_fragmentation / 100.0
-                frag_threshold = 0.4 - (frag_intensity * 0.7)  # More aggressive threshold
-                
-                if frag_noise > frag_threshold:
-                    # Create realistic chunk removal with varied damage
-                    damage_amount = ((frag_noise - frag_threshold) / (1.0 - frag_threshold))
-                    # Use power curve for more realistic damage distribution
-                    damage_curve = damage_amount ** (0.8 - frag_intensity * 0.3)
-                    fragmentation_factor = max(0.02, 1.0 - damage_curve * frag_intensity * 1.8)
-            
-            # Apply fragmentation to both position and height
-            final_rim_height = (self.rim_height + height_variation) * fragmentation_factor
-            
-            rim_verts.append(bm.verts.new((x, y, final_rim_height)))
-        all_ring_verts.append(rim_verts)
+                all_ring_verts.append(
+                    self.create_circle_ring(ring_coords, unit_circle, rim_radius, combined_factor, base_height)
+                )
+        
+        # Create main rim ring with crater outline irregularity
+        combined_factor = rim_asymmetry * self.outline_factor(unit_circle, 1.0, 0.25)
+        
+        x = rim_radius * cos_a * combined_factor
+        y = rim_radius * sin_a * combined_factor
+        flat_pos = np.column_stack((x, y, np.zeros(resolution)))
+        
+        # Completely rebuilt rim height variation with much better noise
+        height_variation = 0.0
+        if self.rim_height_variation > 0:
+            # Use multiple noise layers for realistic geological variation
+            height_pos = flat_pos * (self.rim_noise_scale * 0.03)  # Better base scaling
+            height_noise = fractal_perlin(height_pos, RIM_HEIGHT_OCTAVES)
+            # Much more dramatic and realistic height variation
+            height_variation = height_noise * self.rim_height_variation * self.rim_height * 2.0
+        
+        # Completely rebuilt edge fragmentation with realistic crater damage
+        fragmentation_factor = 1.0
+        if self.edge_fragmentation > 0:
+            # Multiple fragmentation patterns for realistic explosive damage
+            frag_pos = flat_pos * 0.008  # Fine-tuned scale
+            # Large blast chunks, medium debris patterns and fine fragmentation detail
+            frag_noise = fractal_perlin(frag_pos, FRAGMENT_OCTAVES)
+            
+            # Improved fragmentation with realistic damage patterns
+            frag_intensity = self.edge_fragmentation / 100.0
+            frag_threshold = 0.4 - (frag_intensity * 0.7)  # More aggressive threshold
+            
+            # Create realistic chunk removal with varied damage (zero below the threshold)
+            damage_amount = np.maximum(frag_noise - frag_threshold, 0.0) / (1.0 - frag_threshold)
+            # Use power curve for more realistic damage distribution
+            damage_curve = damage_amount ** (0.8 - frag_intensity * 0.3)
+            # Undamaged points have a zero curve and keep a factor of exactly 1.0,
+            # so no separate threshold select is needed
+            fragmentation_factor = np.maximum(0.02, 1.0 - damage_curve * (frag_intensity * 1.8))
+        
+        # Apply fragmentation to both position and height
+        final_rim_height = (self.rim_height + height_variation) * fragmentation_factor
+        
+        all_ring_verts.append(self.create_ring_verts(ring_coords, x, y, final_rim_height))
         
         # Create inner crater bowl with inner wall angle support and inner asymmetry
-        inner_rings = max(1, min(2, self.resolution // 20))
+        inner_rings = 1 if self.optimize_for_games else max(1, min(2, self.resolution // 20))
         
         # Calculate inner wall angle offset
         inner_wall_angle_rad = math.radians(self.inner_wall_angle)
         inner_wall_offset_factor = math.tan(inner_wall_angle_rad) * 2.0  # Multiplier for effect
         
-        # Generate random direction for inner asymmetry (different from blast asymmetry)
+        # Inner asymmetry uses its own direction (different from blast asymmetry)
         if self.inner_asymmetry > 0:
-            inner_asymmetry_angle = random.uniform(0, 2 * math.pi)
-        else:
-            inner_asymmetry_angle = 0.0
+            inner_alignment = np.cos(angles - inner_asymmetry_angle)
+        
+        # Apply blast asymmetry to inner crater
+        blast_asymmetry_factor = 1.0 + blast_push * 0.4  # Increased from 0.1 to 0.4
         
         for ring in range(1, inner_rings + 1):
             ring_factor = ring / inner_rings
@@ -788,46 +890,28 @@ class MESH_OT_add_crater(Operator):
             # Crater depth calculation
             z = self.rim_height - depth_factor
             
-            ring_verts = []
-            for i in range(self.resolution):
-                angle = 2 * math.pi * i / self.resolution
+            # Improved inner asymmetry with better noise and directional effects
+            if self.inner_asymmetry > 0:
+                # Multiple noise layers for more natural irregular patterns
+                noise_input = (unit_circle + (0.0, 0.0, ring_factor)) * 3.0
+                noise_variation = fractal_perlin(noise_input, INNER_OCTAVES)
                 
-                # Apply blast asymmetry to inner crater
-                point_direction = angle - blast_angle_rad
-                alignment = math.cos(point_direction)
-                blast_asymmetry_factor = 1.0 + self.blast_asymmetry * alignment * 0.4  # Increased from 0.1 to 0.4
+                # Improved asymmetry combining directional bias with organic noise
+                directional_component = inner_alignment * 0.4  # Directional blast pattern
+                noise_component = noise_variation * 0.8        # Organic irregularity
                 
-                # Improved inner asymmetry with better noise and directional effects
-                if self.inner_asymmetry > 0:
-                    inner_point_direction = angle - inner_asymmetry_angle
-                    inner_alignment = math.cos(inner_point_direction)
-                    
-                    # Multiple noise layers for more natural irregular patterns
-                    noise_input = Vector((math.cos(angle), math.sin(angle), ring_factor)) * 3.0
-                    noise_variation = (
-                        noise.noise(noise_input * 1.0) * 0.4 +      # Large-scale deformation
-                        noise.noise(noise_input * 4.0) * 0.35 +     # Medium bumps/indents
-                        noise.noise(noise_input * 10.0) * 0.25      # Fine surface variation
-                    )
-                    
-                    # Improved asymmetry combining directional bias with organic noise
-                    directional_component = inner_alignment * 0.4  # Directional blast pattern
-                    noise_component = noise_variation * 0.8        # Organic irregularity
-                    
-                    inner_asymmetry_factor = 1.0 + self.inner_asymmetry * (
-                        directional_component + noise_component
-                    )
-                else:
-                    inner_asymmetry_factor = 1.0
-                
-                # Combine both asymmetry effects
-                combined_asymmetry = blast_asymmetry_factor * inner_asymmetry_factor
-                
-                x = ring_radius * math.cos(angle) * combined_asymmetry
-                y = ring_radius * math.sin(angle) * combined_asymmetry
-                
-                ring_verts.append(bm.verts.new((x, y, z)))
-            all_ring_verts.append(ring_verts)
+                inner_asymmetry_factor = 1.0 + self.inner_asymmetry * (
+                    directional_component + noise_component
+                )
+            else:
+                inner_asymmetry_factor = 1.0
+            
+            # Combine both asymmetry effects
+            combined_asymmetry = blast_asymmetry_factor * inner_asymmetry_factor
+            
+            all_ring_verts.append(
+                self.create_circle_ring(ring_coords, unit_circle, ring_radius, combined_asymmetry, z)
+            )
         
         # Create center point at the bottom of the crater with inner wall angle consideration
         center_height = -self.depth  # Center is at full crater depth below ground
@@ -838,117 +922,76 @@ class MESH_OT_add_crater(Operator):
         
         # Apply inner asymmetry to center point as well
         if self.inner_asymmetry > 0:
-            center_noise = noise.noise(Vector((0, 0, 1)) * 3.0) * self.inner_asymmetry * 0.2
+            center_noise = perlin_noise([(0.0, 0.0, 3.0)])[0] * self.inner_asymmetry * 0.2
             center_x = center_radius_adjustment * 0.1 + center_noise
             center_y = center_radius_adjustment * 0.1 + center_noise * 0.7
         else:
             center_x = center_radius_adjustment * 0.1  # Small offset for realistic effect
             center_y = center_radius_adjustment * 0.1
         
-        center_vert = bm.verts.new((center_x, center_y, center_height))
-        all_ring_verts.append([center_vert])
-        
-        # Connect rings with quads
-        for ring_idx in range(len(all_ring_verts) - 1):
-            current_ring = all_ring_verts[ring_idx]
-            next_ring = all_ring_verts[ring_idx + 1]
-            
-            if len(next_ring) == 1:  # Connect to center
-                for i in range(len(current_ring)):
-                    next_i = (i + 1) % len(current_ring)
-                    tri_verts = [current_ring[i], current_ring[next_i], next_ring[0]]
-                    bm.faces.new(tri_verts)
-            else:  # Connect rings
-                for i in range(len(current_ring)):
-                    next_i = (i + 1) % len(current_ring)
-                    quad_verts = [
-                        current_ring[i], current_ring[next_i],
-                        next_ring[next_i], next_ring[i]
-                    ]
-                    try:
-                        bm.faces.new(quad_verts)
-                    except:
-                        pass
+        self.create_ring_verts(ring_coords, [center_x], [center_y], center_height)
         
         # Close the bottom if requested
         if self.close_bottom:
-            self.create_crater_bottom(bm, all_ring_verts)
+            self.create_crater_bottom(ring_coords)
         
-        bm.normal_update()
-        bm.faces.ensure_lookup_table()
-    
-    def create_crater_bottom(self, bm, all_ring_verts):
-        """Create a closed bottom for the crater with slanted outer walls"""
-        # Get the outermost ring (base ring)
-        base_ring = all_ring_verts[0]
+        # Connectivity only depends on the ring layout, so it comes from the cache
+        face_sizes, corner_verts = crater_topology(
+            len(all_ring_verts), resolution, self.close_bottom, self.optimize_for_games
+        )
         
+        return np.concatenate(ring_coords), face_sizes, corner_verts
+    
+    def outline_factor(self, unit_circle, noise_z, strength, octaves=OUTLINE_OCTAVES, noise_scale=1.0):
+        """Per-point radius multiplier from crater outline irregularity (1.0 when disabled)
+        
+        Noise is sampled on the unit circle lifted to noise_z, so every ring
+        gets its own variation of the same outline.
+        """
+        if self.crater_outline_irregularity <= 0:
+            return 1.0
+        irregularity = self.crater_outline_irregularity / 50.0  # Adjusted for 0-50 range
+        noise_pos = (unit_circle + (0.0, 0.0, noise_z)) * noise_scale
+        return 1.0 + fractal_perlin(noise_pos, octaves) * irregularity * strength
+    
+    def create_circle_ring(self, ring_coords, unit_circle, radius, factor, z):
+        """Append a ring of radius scaled per point by factor and return its index range"""
+        x = radius * unit_circle[:, 0] * factor
+        y = radius * unit_circle[:, 1] * factor
+        return self.create_ring_verts(ring_coords, x, y, z)
+    
+    def create_ring_verts(self, ring_coords, x, y, z):
+        """Append one ring from coordinate arrays (z may be scalar) and return its index range"""
+        coords = np.column_stack((x, y, np.broadcast_to(z, np.shape(x))))
+        start = sum(len(block) for block in ring_coords)
+        ring_coords.append(coords)
+        return range(start, start + len(coords))
+    
+    def create_crater_bottom(self, ring_coords):
+        """Create the vertices of a closed bottom for the crater with slanted outer walls"""
         # Create bottom vertices at a depth below the crater
         bottom_depth = -self.bottom_thickness
-        bottom_verts = []
         
         # Calculate outer wall offset based on outer wall angle
         outer_wall_angle_rad = math.radians(self.outer_wall_angle)
         # Increased multiplier for more visible effect
         wall_offset = self.bottom_thickness * math.tan(outer_wall_angle_rad) * 3.0
         
-        # Create intermediate rings for slanted walls - more rings for smoother effect
-        wall_rings = 5  # Increased from 3 to 5 for smoother slant
-        all_wall_rings = []
-        
-        # Add the base ring as first wall ring
-        all_wall_rings.append(base_ring)
+        # Outward direction of every base vertex, shared by all wall rings
+        # The base ring is the first coordinate block
+        base_xy = ring_coords[0][:, :2]
+        distance = np.hypot(base_xy[:, 0], base_xy[:, 1])[:, np.newaxis]
+        direction = np.divide(base_xy, distance, out=np.zeros_like(base_xy), where=distance > 0)
         
-        # Create intermediate rings with progressive offset
-        for ring_idx in range(1, wall_rings):
-            ring_factor = ring_idx / wall_rings
-            ring_depth = -self.bottom_thickness * ring_factor
-            # Use exponential curve for more dramatic effect
-            ring_offset = wall_offset * (ring_factor ** 1.5)
-            
-            ring_verts = []
-            for vert in base_ring:
-                # Calculate direction from center for offset
-                direction_x = vert.co.x
-                direction_y = vert.co.y
-                distance = math.sqrt(direction_x**2 + direction_y**2)
-                
-                if distance > 0:
-                    # Normalize direction and apply progressive offset
-                    norm_x = direction_x / distance
-                    norm_y = direction_y / distance
-                    
-                    new_x = vert.co.x + norm_x * ring_offset
-                    new_y = vert.co.y + norm_y * ring_offset
-                else:
-                    new_x = vert.co.x
-                    new_y = vert.co.y
-                
-                ring_verts.append(bm.verts.new((new_x, new_y, ring_depth)))
-            
-            all_wall_rings.append(ring_verts)
-        
-        # Create final bottom ring with full offset
-        for vert in base_ring:
-            # Calculate direction from center for offset
-            direction_x = vert.co.x
-            direction_y = vert.co.y
-            distance = math.sqrt(direction_x**2 + direction_y**2)
-            
-            if distance > 0:
-                # Normalize direction and apply full offset
-                norm_x = direction_x / distance
-                norm_y = direction_y / distance
-                
-                bottom_x = vert.co.x + norm_x * wall_offset
-                bottom_y = vert.co.y + norm_y * wall_offset
-            else:
-                bottom_x = vert.co.x
-                bottom_y = vert.co.y
-            
-            bottom_z = bottom_depth
-            bottom_verts.append(bm.verts.new((bottom_x, bottom_y, bottom_z)))
+        # Intermediate rings get a progressive offset, the last one is the bottom ring with full offset
+        ring_factors = np.arange(1, BOTTOM_WALL_RINGS + 1) / BOTTOM_WALL_RINGS
+        # Use exponential curve for more dramatic effect
+        ring_offsets = wall_offset * ring_factors ** 1.5
+        ring_depths = bottom_depth * ring_factors
         
-        all_wall_rings.append(bottom_verts)
+        for ring_offset, ring_depth in zip(ring_offsets, ring_depths):
+            ring_xy = base_xy + direction * ring_offset
+            self.create_ring_verts(ring_coords, ring_xy[:, 0], ring_xy[:, 1], ring_depth)
         
         # Create center bottom vertex - also offset it based on outer wall angle
         center_offset_x = 0
@@ -958,122 +1001,76 @@ class MESH_OT_add_crater(Operator):
             center_offset_x = wall_offset * 0.1
             center_offset_y = wall_offset * 0.1
         
-        center_bottom = bm.verts.new((center_offset_x, center_offset_y, bottom_depth))
+        self.create_ring_verts(ring_coords, [center_offset_x], [center_offset_y], bottom_depth)
+    
+    def apply_minimal_detail(self, vertices):
+        """Apply surface noise with different levels inside vs outside rim
         
-        # Connect wall rings to create slanted walls
-        for ring_idx in range(len(all_wall_rings) - 1):
-            current_ring = all_wall_rings[ring_idx]
-            next_ring = all_wall_rings[ring_idx + 1]
-            
-            for i in range(len(current_ring)):
-                next_i = (i + 1) % len(current_ring)
-                try:
-                    # Create quad connecting current ring to next ring
-                    quad_face = bm.faces.new([
-                        current_ring[i], current_ring[next_i],
-                        next_ring[next_i], next_ring[i]
-                    ])
-                    # Don't set material here - let material assignment function handle it
-                except:
-                    pass
-        
-        # Create bottom faces (close the bottom)
-        for i in range(len(bottom_verts)):
-            next_i = (i + 1) % len(bottom_verts)
-            try:
-                # Create triangular faces from outer bottom ring to center
-                tri_face = bm.faces.new([bottom_verts[i], bottom_verts[next_i], center_bottom])
-                # Don't set material here - let material assignment function handle it
-            except:
-                pass
-    
-    def apply_minimal_detail(self, bm):
-        """Apply surface noise with different levels inside vs outside rim"""
+        vertices is an (N, 3) array and is displaced in place.
+        """
         if self.noise_strength <= 0 and self.outside_noise_strength <= 0:
             return
-            
-        for vert in bm.verts:
-            # Multiple octave noise for smoother result
-            pos = vert.co
-            noise_val = (
-                noise.noise(pos * 1.0) * 0.5 +      # Large features
-                noise.noise(pos * 3.0) * 0.3 +      # Medium features  
-                noise.noise(pos * 8.0) * 0.2        # Fine detail
-            )
-            
-            # Determine if vertex is inside or outside crater rim with transition zone
-            distance_from_center = math.sqrt(vert.co.x**2 + vert.co.y**2)
-            rim_radius = self.inner_radius  # FIXED: use inner_radius consistently
-            transition_width = rim_radius * 0.3  # 30% transition zone
-            
-            # Create smooth transition between inside and outside
-            if distance_from_center < rim_radius - transition_width:
-                # Clearly inside
-                noise_strength = self.noise_strength
-            elif distance_from_center > rim_radius + transition_width:
-                # Clearly outside  
-                noise_strength = self.outside_noise_strength
-            else:
-                # Transition zone - blend between inside and outside
-                blend_factor = (distance_from_center - (rim_radius - transition_width)) / (2 * transition_width)
-                blend_factor = max(0, min(1, blend_factor))
-                noise_strength = self.noise_strength * (1 - blend_factor) + self.outside_noise_strength * blend_factor
-            
-            # Apply noise with much gentler scaling
-            final_noise = noise_val * noise_strength * 0.1  # Reduced from 0.3 to 0.1
-            
-            # Apply with falloff and clamping to prevent spikes
-            base_radius = self.outer_radius * 2.0  # FIXED: use outer_radius
-            if distance_from_center < base_radius:
-                falloff = 1.0 - (distance_from_center / base_radius)
-                noise_offset = final_noise * falloff * 0.3  # Reduced from 0.5 to 0.3
-                
-                # Clamp noise to prevent extreme spikes
-                max_noise = min(self.rim_height * 0.2, 0.5)  # Max 20% of rim height or 0.5m
-                noise_offset = max(-max_noise, min(max_noise, noise_offset))
-                
-                vert.co.z += noise_offset
+        
+        # Noise falls off to zero at base radius, so only vertices inside it are sampled
+        # The cull compares squared distances; the root is only taken for the vertices kept
+        base_radius = self.outer_radius * 2.0  # FIXED: use outer_radius
+        distance_sq = vertices[:, 0] * vertices[:, 0] + vertices[:, 1] * vertices[:, 1]
+        inside = distance_sq < base_radius * base_radius
+        if not inside.any():
+            return
+        distance_from_center = np.sqrt(distance_sq[inside])
+        
+        # Multiple octave noise for smoother result (large, medium and fine features)
+        noise_val = fractal_perlin(vertices[inside], DETAIL_OCTAVES)
+        
+        # Determine if vertex is inside or outside crater rim with transition zone
+        rim_radius = self.inner_radius  # FIXED: use inner_radius consistently
+        transition_width = rim_radius * 0.3  # 30% transition zone
+        
+        # Create smooth transition between inside (0) and outside (1)
+        blend_factor = (distance_from_center - (rim_radius - transition_width)) / (2 * transition_width)
+        blend_factor = np.clip(blend_factor, 0.0, 1.0)
+        noise_strength = self.noise_strength * (1 - blend_factor) + self.outside_noise_strength * blend_factor
+        
+        # Apply noise with much gentler scaling
+        final_noise = noise_val * noise_strength * 0.1  # Reduced from 0.3 to 0.1
+        
+        # Apply with linear falloff towards base radius and clamping to prevent spikes
+        falloff = 1.0 - distance_from_center / base_radius
+        noise_offset = final_noise * falloff * 0.3  # Reduced from 0.5 to 0.3
+        
+        max_noise = min(self.rim_height * 0.2, 0.5)  # Max 20% of rim height or 0.5m
+        vertices[inside, 2] += np.clip(noise_offset, -max_noise, max_noise)
     
     def optimize_crater_topology(self, bm):
         """Clean up topology for games"""
-        # Remove duplicate vertices
+        # Remove duplicate vertices - the last slope ring sits on (or within a
+        # millimetre of) the main rim ring, and the first edge-rounding ring
+        # starts on top of the ring it rounds off
         bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.001)
         
         # Remove degenerate geometry
         bmesh.ops.dissolve_degenerate(bm, edges=bm.edges, dist=0.0001)
         
-        # Recalculate normals
+        # Recalculate normals (faces are already built as triangles)
         bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
-        
-        # Triangulate for game engines
-        bmesh.ops.triangulate(
-            bm, 
-            faces=bm.faces,
-            quad_method='BEAUTY',
-            ngon_method='BEAUTY'
-        )
     
     def optimize_mesh_for_games(self, mesh):
         """Final game optimizations"""
-        mesh.validate(verbose=False, clean_customdata=True)
-        mesh.calc_loop_triangles()
-        mesh.update()
+        # bm.to_mesh already left the mesh consistent; only refresh it if validate fixed something
+        if mesh.validate(verbose=False, clean_customdata=True):
+            mesh.update()
         
         # Set smooth shading
-        for poly in mesh.polygons:
-            poly.use_smooth = True
+        mesh.polygons.foreach_set("use_smooth", np.ones(len(mesh.polygons), dtype=bool))
     
     def setup_clean_materials(self, obj):
-        """Create clean materials for crater"""
+        """Apply the shared crater materials and assign them per face"""
         try:
             obj.data.materials.clear()
             
-            # Inner crater material - use the specified dirt material if available
-            inner_mat = self.create_inner_material()
+            inner_mat, outer_mat = self.get_shared_materials()
             obj.data.materials.append(inner_mat)
-            
-            # Outer slope material
-            outer_mat = self.create_outer_material()
             obj.data.materials.append(outer_mat)
             
             # Assign materials
@@ -1082,29 +1079,25 @@ class MESH_OT_add_crater(Operator):
         except Exception as e:
             print(f"Material setup error: {e}")
     
-    def create_inner_material(self):
-        """Create inner crater material"""
-        # Create standard inner crater material (not using the dirt material)
-        mat = bpy.data.materials.new(name="Crater_Inner")
-        mat.use_nodes = True
-        nodes = mat.node_tree.nodes
-        links = mat.node_tree.links
-        nodes.clear()
-        
-        # Simple material setup
-        output = nodes.new('ShaderNodeOutputMaterial')
-        principled = nodes.new('ShaderNodeBsdfPrincipled')
-        
-        # Dark crater color
-        principled.inputs['Base Color'].default_value = (0.15, 0.1, 0.08, 1.0)
-        principled.inputs['Roughness'].default_value = 0.9
+    def get_shared_materials(self):
+        """Return the (inner, outer) crater materials shared by every crater
         
-        links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-        return mat
+        Both are created on first use and reused afterwards, so generating
+        many craters doesn't leave Crater_Inner.001, .002, ... behind.
+        """
+        # Inner crater material - dark crater color
+        inner_mat = bpy.data.materials.get("Crater_Inner") or self.create_crater_material(
+            "Crater_Inner", (0.15, 0.1, 0.08, 1.0), 0.9
+        )
+        # Outer slope material - earth color
+        outer_mat = bpy.data.materials.get("Crater_Outer") or self.create_crater_material(
+            "Crater_Outer", (0.5, 0.4, 0.3, 1.0), 0.8
+        )
+        return inner_mat, outer_mat
     
-    def create_outer_material(self):
-        """Create outer slope material"""
-        mat = bpy.data.materials.new(name="Crater_Outer")
+    def create_crater_material(self, name, base_color, roughness):
+        """Create a simple Principled BSDF crater material"""
+        mat = bpy.data.materials.new(name=name)
         mat.use_nodes = True
         nodes = mat.node_tree.nodes
         links = mat.node_tree.links
@@ -1114,155 +1107,230 @@ class MESH_OT_add_crater(Operator):
         output = nodes.new('ShaderNodeOutputMaterial')
         principled = nodes.new('ShaderNodeBsdfPrincipled')
         
-        # Earth color
-        principled.inputs['Base Color'].default_value = (0.5, 0.4, 0.3, 1.0)
-        principled.inputs['Roughness'].default_value = 0.8
+        principled.inputs['Base Color'].default_value = base_color
+        principled.inputs['Roughness'].default_value = roughness
         
         links.new(principled.outputs['BSDF'], output.inputs['Surface'])
         return mat
     
     def assign_materials_clean(self, obj):
         """Assign materials based on analyzed crater geometry"""
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.faces.ensure_lookup_table()
+        mesh = obj.data
+        face_count = len(mesh.polygons)
+        centers = np.empty(face_count * 3, dtype=np.float32)
+        normals = np.empty(face_count * 3, dtype=np.float32)
+        mesh.polygons.foreach_get("center", centers)
+        mesh.polygons.foreach_get("normal", normals)
+        centers = centers.reshape(-1, 3)
+        center_z = centers[:, 2]
+        normal_z = normals[2::3]
+        # Radial distances are only compared against thresholds, so keep them squared
+        distance_sq = centers[:, 0] * centers[:, 0] + centers[:, 1] * centers[:, 1]
         
         # Based on your analysis: rim peak at distance 1.622, base at 2.575
         # Scale these proportionally to the current crater size
         rim_distance = self.inner_radius
-        base_distance = self.outer_radius
         
-        for face in bm.faces:
-            face_center = face.calc_center_median()
-            distance_from_center = math.sqrt(face_center.x**2 + face_center.y**2)
-            
-            # Special handling for bottom closure geometry
-            if self.close_bottom:
-                # Flat bottom: at the bottom thickness level (regardless of distance)
-                if face_center.z <= (-self.bottom_thickness + 0.05):
-                    face.material_index = 1  # Outer material for flat bottom
-                    continue
-                    
-                # Side walls: below ground AND outside the main crater area
-                if (face_center.z < -0.05 and  # Below ground
-                    distance_from_center > self.outer_radius * 0.8):  # Outside main crater
-                    face.material_index = 1  # Outer material for side walls
-                    continue
-            
-            # Normal crater material assignment
-            # Inner material: rim area and inner crater (steep areas)
-            # Outer material: gentle outer slopes
-            is_inner = (
-                # Around rim peak area
-                distance_from_center < rim_distance * 1.2 or
-                # High elevation areas (above 40% of rim height)
-                face_center.z > self.rim_height * 0.4 or
-                # Steep slopes (your analysis showed steep inner areas)
-                face.normal.z < 0.4
-            )
-            
-            face.material_index = 0 if is_inner else 1
+        # Normal crater material assignment
+        # Inner material: rim area and inner crater (steep areas)
+        # Outer material: gentle outer slopes
+        is_inner = (
+            # Around rim peak area
+            (distance_sq < (rim_distance * 1.2) ** 2) |
+            # High elevation areas (above 40% of rim height)
+            (center_z > self.rim_height * 0.4) |
+            # Steep slopes (your analysis showed steep inner areas)
+            (normal_z < 0.4)
+        )
         
-        bmesh.update_edit_mesh(obj.data)
-        bpy.ops.object.mode_set(mode='OBJECT')
+        # Special handling for bottom closure geometry
+        if self.close_bottom:
+            # Flat bottom: at the bottom thickness level (regardless of distance)
+            bottom = center_z <= (-self.bottom_thickness + 0.05)
+            # Side walls: below ground AND outside the main crater area
+            side_walls = (center_z < -0.05) & (distance_sq > (self.outer_radius * 0.8) ** 2)
+            # Outer material for flat bottom and side walls
+            is_inner &= ~(bottom | side_walls)
+        
+        # Index 1 (outer) wherever the face isn't inner; int32 matches the RNA int buffer
+        mesh.polygons.foreach_set("material_index", (~is_inner).astype(np.int32))
     
     def generate_crater_uvs(self, obj):
-        """Generate clean UV mapping optimized for craters"""
+        """Generate polar UV mapping around the crater center
+        
+        On the top surface U follows the angle around the crater and V the
+        distance from its center. A closed crater keeps the top in the lower
+        half of the map, gives its side walls a band above it with V stepping
+        down the wall rings, and projects the bottom flat, mirrored as seen
+        from below, into its own region at the top of the map.
+        
+        Walls and bottom are found by vertex index, so this runs on the mesh
+        as generated, before topology cleanup reindexes it.
+        """
         try:
-            bpy.context.view_layer.objects.active = obj
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_all(action='SELECT')
-            
-            if not obj.data.uv_layers:
-                bpy.ops.mesh.uv_texture_add()
+            mesh = obj.data
+            if not mesh.uv_layers:
+                mesh.uv_layers.new(name="UVMap")
+            uv_layer = mesh.uv_layers.active
+            
+            coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", coords)
+            coords = coords.reshape(-1, 3)
+            loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+            mesh.loops.foreach_get("vertex_index", loop_verts)
+            loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+            loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+            mesh.polygons.foreach_get("loop_start", loop_starts)
+            mesh.polygons.foreach_get("loop_total", loop_totals)
+            
+            # Rings are built around the object origin, so project from it
+            loop_x = coords[loop_verts, 0]
+            loop_y = coords[loop_verts, 1]
+            u = np.arctan2(loop_y, loop_x) / (2 * math.pi) + 0.5
+            radius = np.hypot(loop_x, loop_y)
+            
+            # Faces straddling the angular seam get their low side wrapped past 1.0
+            span = np.maximum.reduceat(u, loop_starts) - np.minimum.reduceat(u, loop_starts)
+            crosses_seam = np.repeat(span > 0.5, loop_totals)
+            u[crosses_seam & (u < 0.5)] += 1.0
             
-            # Clear any existing UV data
-            bpy.ops.mesh.select_all(action='SELECT')
+            if self.close_bottom:
+                # The wall rings and bottom center are the last vertices; every
+                # wall face uses a wall ring and every bottom face the bottom center
+                bottom_center = len(mesh.vertices) - 1
+                wall_start = bottom_center - BOTTOM_WALL_RINGS * self.resolution
+                face_max_vert = np.repeat(np.maximum.reduceat(loop_verts, loop_starts), loop_totals)
+                is_bottom = face_max_vert == bottom_center
+                is_wall = (face_max_vert >= wall_start) & ~is_bottom
+                is_top = ~(is_bottom | is_wall)
+                
+                v = np.empty_like(u)
+                v[is_top] = 0.5 * radius[is_top] / max(radius[is_top].max(), 1e-6)
+                # Wall faces share the base ring, which counts as wall ring 0
+                wall_verts = loop_verts[is_wall]
+                wall_ring = np.where(wall_verts >= wall_start, (wall_verts - wall_start) // self.resolution + 1, 0)
+                v[is_wall] = 0.55 + 0.2 * wall_ring / BOTTOM_WALL_RINGS
+                bottom_radius = max(radius[is_bottom].max(), 1e-6)
+                u[is_bottom] = 0.5 - 0.1 * loop_x[is_bottom] / bottom_radius
+                v[is_bottom] = 0.9 + 0.1 * loop_y[is_bottom] / bottom_radius
+            else:
+                v = radius / max(radius.max(), 1e-6)
             
-            # Use cylindrical projection which works well for crater geometry
-            bpy.ops.uv.cylinder_project(
-                direction='VIEW_ON_EQUATOR',
-                align='POLAR_ZZ',
-                scale_to_bounds=False,
-                correct_aspect=True
-            )
+            uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+            uvs[0::2] = u
+            uvs[1::2] = v
+            uv_layer.data.foreach_set("uv", uvs)
+            return True
             
-            # Follow up with angle-based seams for better unwrapping
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.uv.angle_based_unwrap(
-                angle_limit=math.radians(66),  # More generous angle limit
-                margin=0.001
-            )
+        except Exception as e:
+            print(f"UV mapping error: {e}")
+            return False
+
+
+@functools.lru_cache(maxsize=8)
+def seeded_crater_data(params):
+    """Crater arrays for a seeded CraterParams, cached across operator redos
+    
+    build() resets the settings that don't shape the geometry before calling
+    this, so only geometry changes miss the cache. The vertex array is made read-only since every caller shares it.
+    """
+    crater_data = CraterBuilder(params).generate_clean_crater()
+    crater_data['vertices'].setflags(write=False)
+    return crater_data
+
+
+def build_crater(context, settings, select=True):
+    """Build a crater directly from settings, without going through bpy.ops
+    
+    settings is snapshotted into CraterParams first, so generation never
+    goes back through RNA property access.
+    """
+    return CraterBuilder(CraterParams.from_settings(settings)).build(context, select)
+
+
+class MESH_OT_add_crater(Operator):
+    """Generate clean game-ready crater mesh based on real crater analysis"""
+    bl_idname = "mesh.add_crater"
+    bl_label = "Add Game Crater"
+    bl_options = {'REGISTER', 'UNDO', 'PRESET'}
+    
+    # Operator properties for undo panel - MUST MATCH PropertyGroup names exactly
+    outer_radius: FloatProperty(name="Outer Radius", default=2.6, min=0.5, max=100.0)
+    inner_radius: FloatProperty(name="Inner Radius", default=1.3, min=0.1, max=50.0)
+    depth: FloatProperty(name="Depth", default=0.5, min=0.1, max=100.0)
+    rim_height: FloatProperty(name="Rim Height", default=0.58, min=0.0, max=100.0)
+    resolution: IntProperty(name="Resolution", default=24, min=8, max=500)
+    noise_strength: FloatProperty(name="Inside Noise", default=0.0, min=0.0, max=30.0)
+    outside_noise_strength: FloatProperty(name="Outside Noise", default=0.0, min=0.0, max=30.0)
+    create_materials: BoolProperty(name="Materials", default=True)
+    auto_uv: BoolProperty(name="Auto UV", default=True)
+    optimize_for_games: BoolProperty(name="Game Optimization", default=True)
+    close_bottom: BoolProperty(name="Close Bottom", default=True)
+    center_origin: BoolProperty(name="Center Origin", default=False)
+    bottom_thickness: FloatProperty(name="Bottom Thickness", default=1.0, min=0.1, max=10.0)
+    outer_wall_angle: FloatProperty(name="Outer Wall Angle", default=0.0, min=-89.0, max=89.0)
+    inner_wall_angle: FloatProperty(name="Inner Wall Angle", default=0.0, min=-89.0, max=89.0)
+    rim_height_variation: FloatProperty(name="Rim Variation", default=0.0, min=0.0, max=1.0)
+    rim_noise_scale: FloatProperty(name="Rim Noise Scale", default=3.0, min=0.5, max=10.0)
+    blast_asymmetry: FloatProperty(name="Blast Asymmetry", default=0.0, min=0.0, max=1.0)
+    edge_fragmentation: FloatProperty(name="Edge Fragmentation", default=0.0, min=0.0, max=100.0)
+    inner_asymmetry: FloatProperty(name="Inner Asymmetry", default=0.0, min=0.0, max=1.0)
+    crater_outline_irregularity: FloatProperty(name="Crater Outline Irregularity", default=0.0, min=0.0, max=50.0)
+    rim_edge_rounding: FloatProperty(name="Rim Edge Rounding", default=0.0, min=0.0, max=1.0)
+    outer_edge_rounding: FloatProperty(name="Outer Edge Rounding", default=0.0, min=0.0, max=1.0)
+    center_origin_z_offset: FloatProperty(name="Center Origin Z Offset", default=0.0, min=-10.0, max=10.0)
+    random_seed: IntProperty(name="Random Seed", default=0, min=0)
+    
+    def execute(self, context):
+        try:
+            obj = build_crater(context, self)
             
-            # Pack islands efficiently
-            bpy.ops.uv.pack_islands(
-                rotate=True,
-                margin=0.01,  # Smaller margin for better space usage
-                scale=True,
-                merge_overlap=False
-            )
+            # Report results
+            tri_count = len(obj.data.polygons)
+            vertex_count = len(obj.data.vertices)
             
-            # Additional cleanup: remove doubles in UV space
-            bpy.ops.uv.remove_doubles(threshold=0.02, use_unselected=False)
+            origin_info = "at crater bottom" if self.center_origin else "at ground level"
+            self.report({'INFO'}, f"Crater: {tri_count} triangles, {vertex_count} vertices, origin {origin_info}")
             
-            bpy.ops.object.mode_set(mode='OBJECT')
-            return True
+            return {'FINISHED'}
             
         except Exception as e:
-            print(f"UV mapping error: {e}")
-            # Fallback to simpler method if advanced unwrapping fails
-            try:
-                bpy.ops.object.mode_set(mode='EDIT')
-                bpy.ops.mesh.select_all(action='SELECT')
-                
-                # Simple project from view as fallback
-                bpy.ops.uv.project_from_view(
-                    camera_bounds=True,
-                    correct_aspect=True,
-                    scale_to_bounds=False
-                )
-                
-                bpy.ops.object.mode_set(mode='OBJECT')
-                return True
-            except:
-                bpy.ops.object.mode_set(mode='OBJECT')
-                return False
+            self.report({'ERROR'}, f"Crater generation failed: {str(e)}")
+            return {'CANCELLED'}
     
     def invoke(self, context, event):
         """Called when the operator is invoked from the panel"""
         # Copy values from scene properties to operator properties
         if hasattr(context.scene, 'crater_properties'):
             props = context.scene.crater_properties
-            self.outer_radius = props.outer_radius
-            self.inner_radius = props.inner_radius
-            self.depth = props.depth
-            self.rim_height = props.rim_height
-            self.resolution = props.resolution
-            self.noise_strength = props.noise_strength
-            self.outside_noise_strength = props.outside_noise_strength
-            self.create_materials = props.create_materials
-            self.auto_uv = props.auto_uv
-            self.optimize_for_games = props.optimize_for_games
-            self.close_bottom = props.close_bottom
-            self.center_origin = props.center_origin
-            self.bottom_thickness = props.bottom_thickness
-            self.outer_wall_angle = props.outer_wall_angle
-            self.inner_wall_angle = props.inner_wall_angle
-            self.rim_height_variation = props.rim_height_variation
-            self.rim_noise_scale = props.rim_noise_scale
-            self.blast_asymmetry = props.blast_asymmetry
-            self.edge_fragmentation = props.edge_fragmentation
-            self.inner_asymmetry = props.inner_asymmetry
-            self.crater_outline_irregularity = props.crater_outline_irregularity
-            self.rim_edge_rounding = props.rim_edge_rounding
-            self.outer_edge_rounding = props.outer_edge_rounding
-            self.center_origin_z_offset = props.center_origin_z_offset
+            for name in CRATER_SETTING_NAMES:
+                setattr(self, name, getattr(props, name))
         
         return self.execute(context)
 
 
+def randomize_crater_settings(props):
+    """Randomize all crater parameters in props using its user-defined ranges"""
+    # Draw every ranged float in one vectorized call
+    random_ranges = props.random
+    ranges = np.array([getattr(random_ranges, range_name) for _, range_name in RANDOM_FLOAT_RANGES])
+    values = CRATER_RNG.uniform(ranges[:, 0], ranges[:, 1]).tolist()
+    for (name, _), value in zip(RANDOM_FLOAT_RANGES, values):
+        setattr(props, name, value)
+    
+    # Ensure inner radius is smaller than outer radius
+    if props.inner_radius >= props.outer_radius:
+        props.inner_radius = props.outer_radius * 0.7
+    
+    props.resolution = int(CRATER_RNG.integers(*random_ranges.resolution_range, endpoint=True))
+    props.rim_noise_scale = float(CRATER_RNG.uniform(1.0, 8.0))
+    
+    # Always keep these true for working results
+    props.create_materials = True
+    props.auto_uv = True  
+    props.optimize_for_games = True
+
+
 class MESH_OT_add_random_crater(Operator):
     """Generate randomized crater with varied parameters"""
     bl_idname = "mesh.add_random_crater"
@@ -1270,80 +1338,76 @@ class MESH_OT_add_random_crater(Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
-        # Randomize all crater parameters using user-defined ranges
-        scene = context.scene
-        props = scene.crater_properties
-        
-        # Basic dimensions with realistic ranges
-        props.outer_radius = random.uniform(props.random_outer_radius_min, props.random_outer_radius_max)
-        props.inner_radius = random.uniform(props.random_inner_radius_min, props.random_inner_radius_max)
-        
-        # Ensure inner radius is smaller than outer radius
-        if props.inner_radius >= props.outer_radius:
-            props.inner_radius = props.outer_radius * 0.7
+        props = context.scene.crater_properties
+        randomize_crater_settings(props)
         
-        props.depth = random.uniform(props.random_depth_min, props.random_depth_max)
-        props.rim_height = random.uniform(props.random_rim_height_min, props.random_rim_height_max)
-        props.resolution = random.randint(props.random_resolution_min, props.random_resolution_max)
+        # Generate single crater straight from the randomized scene settings
+        try:
+            build_crater(context, props)
+        except Exception as e:
+            self.report({'ERROR'}, f"Crater generation failed: {str(e)}")
+            return {'CANCELLED'}
         
-        # Surface noise
-        props.noise_strength = random.uniform(props.random_noise_min, props.random_noise_max)
-        props.outside_noise_strength = random.uniform(props.random_outside_noise_min, props.random_outside_noise_max)
+        self.report({'INFO'}, f"Random: Outer={props.outer_radius:.1f} Inner={props.inner_radius:.1f} H={props.rim_height:.1f} Res={props.resolution}")
         
-        # Explosion realism features
-        props.blast_asymmetry = random.uniform(props.random_blast_asymmetry_min, props.random_blast_asymmetry_max)
-        props.edge_fragmentation = random.uniform(props.random_edge_fragmentation_min, props.random_edge_fragmentation_max)
-        props.crater_outline_irregularity = random.uniform(props.random_outline_irregularity_min, props.random_outline_irregularity_max)
-        props.inner_asymmetry = random.uniform(props.random_inner_asymmetry_min, props.random_inner_asymmetry_max)
+        return {'FINISHED'}
+
+
+class MESH_OT_add_crater_batch(Operator):
+    """Generate a grid of randomized craters in one step"""
+    bl_idname = "mesh.add_crater_batch"
+    bl_label = "Add Random Crater Batch"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    count: IntProperty(name="Count", default=9, min=1, max=500)
+    spacing: FloatProperty(name="Spacing", default=12.0, min=0.1, max=1000.0, unit='LENGTH')
+    
+    def execute(self, context):
+        props = context.scene.crater_properties
+        columns = math.ceil(math.sqrt(self.count))
         
-        # Rim features
-        props.rim_height_variation = random.uniform(props.random_rim_variation_min, props.random_rim_variation_max)
-        props.rim_noise_scale = random.uniform(1.0, 8.0)
-        props.outer_edge_rounding = random.uniform(props.random_outer_edge_rounding_min, props.random_outer_edge_rounding_max)
-        props.rim_edge_rounding = random.uniform(props.random_rim_edge_rounding_min, props.random_rim_edge_rounding_max)
+        # Every crater is built directly; the whole batch is a single undo step
+        # and selection is only touched once the batch is complete
+        craters = []
+        try:
+            for index in range(self.count):
+                randomize_crater_settings(props)
+                obj = build_crater(context, props, select=False)
+                # Lay the craters out on a grid starting at the 3D cursor
+                row, column = divmod(index, columns)
+                obj.location.x += column * self.spacing
+                obj.location.y += row * self.spacing
+                craters.append(obj)
+        except Exception as e:
+            self.report({'ERROR'}, f"Crater generation failed: {str(e)}")
+            return {'CANCELLED'}
         
-        # Wall angles
-        props.outer_wall_angle = random.uniform(props.random_wall_angle_min, props.random_wall_angle_max)
-        props.inner_wall_angle = random.uniform(props.random_wall_angle_min, props.random_wall_angle_max)
-        
-        # Always keep these true for working results
-        props.create_materials = True
-        props.auto_uv = True  
-        props.optimize_for_games = True
-        
-        # Generate single crater
-        bpy.ops.mesh.add_crater(
-            outer_radius=props.outer_radius,
-            inner_radius=props.inner_radius,
-            depth=props.depth, 
-            rim_height=props.rim_height,
-            resolution=props.resolution,
-            noise_strength=props.noise_strength,
-            outside_noise_strength=props.outside_noise_strength,
-            create_materials=props.create_materials,
-            auto_uv=props.auto_uv,
-            optimize_for_games=props.optimize_for_games,
-            rim_height_variation=props.rim_height_variation,
-            rim_noise_scale=props.rim_noise_scale,
-            blast_asymmetry=props.blast_asymmetry,
-            edge_fragmentation=props.edge_fragmentation,
-            inner_asymmetry=props.inner_asymmetry,
-            crater_outline_irregularity=props.crater_outline_irregularity,
-            rim_edge_rounding=props.rim_edge_rounding,
-            outer_edge_rounding=props.outer_edge_rounding,
-            center_origin_z_offset=props.center_origin_z_offset,
-            close_bottom=props.close_bottom,
-            center_origin=props.center_origin,
-            bottom_thickness=props.bottom_thickness,
-            outer_wall_angle=props.outer_wall_angle,
-            inner_wall_angle=props.inner_wall_angle
-        )
+        for selected in context.selected_objects:
+            selected.select_set(False)
+        for obj in craters:
+            obj.select_set(True)
+        context.view_layer.objects.active = craters[-1]
         
-        self.report({'INFO'}, f"Random: Outer={props.outer_radius:.1f} Inner={props.inner_radius:.1f} H={props.rim_height:.1f} Res={props.resolution}")
+        self.report({'INFO'}, f"Batch: {len(craters)} random craters")
         
         return {'FINISHED'}
 
 
+def apply_modifiers(context, obj):
+    """Bake every modifier on obj into its mesh with a single depsgraph evaluation
+    
+    All data layers (UV maps, vertex groups, custom attributes) are kept, and
+    obj doesn't need to be selected or active.
+    """
+    old_mesh = obj.data
+    depsgraph = context.evaluated_depsgraph_get()
+    obj_eval = obj.evaluated_get(depsgraph)
+    obj.data = bpy.data.meshes.new_from_object(obj_eval, preserve_all_data_layers=True, depsgraph=depsgraph)
+    obj.modifiers.clear()
+    if old_mesh.users == 0:
+        bpy.data.meshes.remove(old_mesh)
+
+
 class MESH_OT_crater_create_firegeo_collision(Operator):
     """Create FireGeo collision for selected crater objects"""
     bl_idname = "mesh.crater_create_firegeo_collision"
@@ -1376,19 +1440,27 @@ class MESH_OT_crater_create_firegeo_collision(Operator):
         
         # Create or get BuildingFireView collection
         collection_name = "BuildingFireView"
-        if collection_name not in bpy.data.collections:
+        fireview_collection = bpy.data.collections.get(collection_name)
+        if fireview_collection is None:
             fireview_collection = bpy.data.collections.new(collection_name)
             context.scene.collection.children.link(fireview_collection)
-        else:
-            fireview_collection = bpy.data.collections[collection_name]
+        
+        # Use the specific dirt material for FireGeo collision, shared by every part
+        mat = bpy.data.materials.get("dirt_C3691F2D8FE0234F") or bpy.data.materials.get("FireGeo_Material")
+        if mat is None:
+            # Create fallback FireGeo material if specific dirt material doesn't exist
+            mat = bpy.data.materials.new(name="FireGeo_Material")
+            mat.diffuse_color = (0.0, 0.8, 0.0, 0.5)
+        
+        # The face budget is split evenly between the selected parts
+        part_target_faces = int(self.target_faces / len(mesh_objects))
         
         for idx, source_obj in enumerate(mesh_objects):
-            bpy.ops.object.select_all(action='DESELECT')
-            source_obj.select_set(True)
-            context.view_layer.objects.active = source_obj
-            
-            bpy.ops.object.duplicate()
-            dup_obj = context.selected_objects[0]
+            # Copy the object and its mesh into the source's collections
+            dup_obj = source_obj.copy()
+            dup_obj.data = source_obj.data.copy()
+            for collection in source_obj.users_collection:
+                collection.objects.link(dup_obj)
             
             if len(mesh_objects) == 1:
                 dup_obj.name = "UTM_crater"
@@ -1397,13 +1469,13 @@ class MESH_OT_crater_create_firegeo_collision(Operator):
                 
             collision_objects.append(dup_obj)
             
-            part_target_faces = int(self.target_faces / len(mesh_objects))
+            # Flatness drives both the decimation ratio and the merge threshold
+            obj_dimensions = dup_obj.dimensions
+            is_flat = min(obj_dimensions) < max(obj_dimensions) * 0.1
+            
             current_faces = len(dup_obj.data.polygons)
             
             if current_faces > part_target_faces:
-                obj_dimensions = dup_obj.dimensions
-                is_flat = min(obj_dimensions) < max(obj_dimensions) * 0.1
-                
                 if is_flat:
                     target_ratio = max(0.8, part_target_faces / current_faces)
                 else:
@@ -1412,33 +1484,26 @@ class MESH_OT_crater_create_firegeo_collision(Operator):
                 if target_ratio < 1.0:
                     decimate = dup_obj.modifiers.new(name="Decimate", type='DECIMATE')
                     decimate.ratio = max(0.1, target_ratio)
-                    bpy.ops.object.modifier_apply(modifier=decimate.name)
             
             if self.offset > 0:
                 solidify = dup_obj.modifiers.new(name="Solidify", type='SOLIDIFY')
                 solidify.thickness = self.offset
                 solidify.offset = 1.0
-                bpy.ops.object.modifier_apply(modifier=solidify.name)
             
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_all(action='SELECT')
-            obj_dimensions = dup_obj.dimensions
-            is_flat = min(obj_dimensions) < max(obj_dimensions) * 0.1
-            merge_threshold = 0.0001 if is_flat else 0.001
-            bpy.ops.mesh.remove_doubles(threshold=merge_threshold)
-            bpy.ops.object.mode_set(mode='OBJECT')
+            # Bake Decimate and Solidify together
+            if dup_obj.modifiers:
+                apply_modifiers(context, dup_obj)
             
-            # Create or use the specific dirt material for FireGeo collision
-            mat_name = "dirt_C3691F2D8FE0234F"
-            if mat_name in bpy.data.materials:
-                mat = bpy.data.materials[mat_name]
-            else:
-                # Create fallback FireGeo material if specific dirt material doesn't exist
-                if "FireGeo_Material" not in bpy.data.materials:
-                    mat = bpy.data.materials.new(name="FireGeo_Material")
-                    mat.diffuse_color = (0.0, 0.8, 0.0, 0.5)
-                else:
-                    mat = bpy.data.materials["FireGeo_Material"]
+            merge_threshold = 0.0001 if is_flat else 0.001
+            # Merge doubles on the mesh data itself
+            bm = bmesh.new()
+            try:
+                bm.from_mesh(dup_obj.data)
+                bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=merge_threshold)
+                bm.to_mesh(dup_obj.data)
+            finally:
+                bm.free()
+            dup_obj.data.update()
             
             dup_obj.data.materials.clear()
             dup_obj.data.materials.append(mat)
@@ -1516,12 +1581,11 @@ class MESH_OT_crater_create_lods(Operator):
         # Create collection if requested
         if self.create_collection:
             collection_name = f"{base_name}_LOD_Collection"
-            # Check if collection already exists
-            if collection_name not in bpy.data.collections:
+            # Reuse the collection if it already exists
+            new_collection = bpy.data.collections.get(collection_name)
+            if new_collection is None:
                 new_collection = bpy.data.collections.new(collection_name)
                 context.scene.collection.children.link(new_collection)
-            else:
-                new_collection = bpy.data.collections[collection_name]
         
         # Choose reduction ratios
         if self.aggressive_reduction:
@@ -1537,24 +1601,18 @@ class MESH_OT_crater_create_lods(Operator):
             obj_base_name = source_obj.name.replace("_LOD0", "")
             
             for lod in range(1, min(self.lod_levels + 1, 6)):  # Max 5 LODs
-                # Duplicate from source
-                bpy.ops.object.select_all(action='DESELECT')
-                source_obj.select_set(True)
-                context.view_layer.objects.active = source_obj
-                
-                bpy.ops.object.duplicate_move(
-                    OBJECT_OT_duplicate={"linked": False, "mode": 'TRANSLATION'}, 
-                    TRANSFORM_OT_translate={"value": (0, 0, 0)}
-                )
+                # Duplicate from source (object and mesh copies)
+                lod_obj = source_obj.copy()
+                lod_obj.data = source_obj.data.copy()
+                for collection in source_obj.users_collection:
+                    collection.objects.link(lod_obj)
                 
-                lod_obj = context.active_object
                 lod_obj.name = f"{obj_base_name}_LOD{lod}"
                 
                 # Apply decimation
-                bpy.ops.object.modifier_add(type='DECIMATE')
-                decimate_mod = lod_obj.modifiers["Decimate"]
+                decimate_mod = lod_obj.modifiers.new(name="Decimate", type='DECIMATE')
                 decimate_mod.ratio = ratios[lod - 1]
-                bpy.ops.object.modifier_apply(modifier="Decimate")
+                apply_modifiers(context, lod_obj)
                 
                 # Add to collection if enabled
                 if self.create_collection:
@@ -1566,11 +1624,13 @@ class MESH_OT_crater_create_lods(Operator):
                 all_lod_objects[lod].append(lod_obj)
                 created_lods += 1
         
-        # Join LOD levels if requested
-        if self.join_lod_levels:
-            for lod_level, lod_objects in all_lod_objects.items():
-                if len(lod_objects) > 1:  # Only join if multiple objects
-                    self._join_lod_objects(lod_objects, f"{base_name}_LOD{lod_level}")
+        # Join LOD levels if requested, keeping track of the objects left afterwards
+        final_lod_objects = []
+        for lod_level, lod_objects in all_lod_objects.items():
+            if self.join_lod_levels and len(lod_objects) > 1:  # Only join if multiple objects
+                final_lod_objects.append(self._join_lod_objects(lod_objects, f"{base_name}_LOD{lod_level}"))
+            else:
+                final_lod_objects.extend(lod_objects)
         
         # Rename source objects to LOD0
         for source_obj in mesh_objects:
@@ -1583,15 +1643,12 @@ class MESH_OT_crater_create_lods(Operator):
                     context.scene.collection.objects.unlink(source_obj)
                 new_collection.objects.link(source_obj)
         
-        # Select remaining LOD objects (avoid invalid references)
+        # Select the LOD0 sources and the remaining LOD objects - tracked directly,
+        # so joined-away objects are never referenced and the scene isn't scanned
         bpy.ops.object.select_all(action='DESELECT')
-        valid_lod_objects = []
-        
-        for obj_name in bpy.data.objects.keys():
-            if "_LOD" in obj_name and any(obj_name.startswith(f"{base_name}_LOD") for base_name in [obj.name.split("_")[0] for obj in mesh_objects]):
-                obj = bpy.data.objects[obj_name]
-                obj.select_set(True)
-                valid_lod_objects.append(obj)
+        valid_lod_objects = mesh_objects + final_lod_objects
+        for obj in valid_lod_objects:
+            obj.select_set(True)
         
         self.report({'INFO'}, f"Created {created_lods} LOD objects, joined into {len(valid_lod_objects)} final LOD levels")
         return {'FINISHED'}
@@ -1631,91 +1688,18 @@ class MESH_OT_reset_crater_settings(Operator):
     def execute(self, context):
         props = context.scene.crater_properties
         
-        # Reset main parameters
-        props.outer_radius = 2.6
-        props.inner_radius = 1.3
-        props.depth = 0.5
-        props.rim_height = 0.58
-        props.resolution = 24
-        props.noise_strength = 0.05
-        props.outside_noise_strength = 0.02
-        props.create_materials = True
-        props.auto_uv = True
-        props.optimize_for_games = True
-        props.close_bottom = True
-        props.center_origin = False
-        props.bottom_thickness = 1.0
-        props.outer_wall_angle = 0.0
-        props.inner_wall_angle = 0.0
-        props.center_origin_z_offset = 0.0
-        
-        # Reset main parameters to original defaults (surface features now default to 0)
-        props.outer_radius = 2.6
-        props.inner_radius = 1.3
-        props.depth = 0.5
-        props.rim_height = 0.58
-        props.resolution = 24
+        # Put every setting and random range back to its declared default in one
+        # pass; panel display state such as show_random_ranges is left alone
+        for name in CraterProperties.__annotations__:
+            if name != "random" and not name.startswith("show_"):
+                props.property_unset(name)
+        for name in CraterRandomProperties.__annotations__:
+            props.random.property_unset(name)
+        
+        # Surface noise resets to 0, like the operator defaults, rather than to
+        # the scene property defaults
         props.noise_strength = 0.0
         props.outside_noise_strength = 0.0
-        props.create_materials = True
-        props.auto_uv = True
-        props.optimize_for_games = True
-        props.close_bottom = True
-        props.center_origin = False
-        props.bottom_thickness = 1.0
-        props.outer_wall_angle = 0.0
-        props.inner_wall_angle = 0.0
-        props.center_origin_z_offset = 0.0
-        
-        # Reset explosion realism features to defaults (all 0)
-        props.blast_asymmetry = 0.0
-        props.edge_fragmentation = 0.0
-        props.inner_asymmetry = 0.0
-        props.crater_outline_irregularity = 0.0
-        props.rim_edge_rounding = 0.0
-        props.outer_edge_rounding = 0.0
-        
-        # Reset rim variation to defaults (variation = 0, scale = 3.0)
-        props.rim_height_variation = 0.0
-        props.rim_noise_scale = 3.0
-        
-        # Reset random ranges with tighter, more reasonable values
-        props.random_outer_radius_min = 2.0
-        props.random_outer_radius_max = 3.5
-        props.random_inner_radius_min = 1.0
-        props.random_inner_radius_max = 1.8
-        props.random_depth_min = 0.3
-        props.random_depth_max = 0.8
-        props.random_rim_height_min = 0.3
-        props.random_rim_height_max = 0.9
-        props.random_resolution_min = 20
-        props.random_resolution_max = 32
-        props.random_noise_min = 0.02
-        props.random_noise_max = 0.1
-        props.random_outside_noise_min = 0.01
-        props.random_outside_noise_max = 0.05
-        
-        # Reset explosion realism ranges - tighter ranges
-        props.random_blast_asymmetry_min = 0.0
-        props.random_blast_asymmetry_max = 0.2
-        props.random_edge_fragmentation_min = 0.0
-        props.random_edge_fragmentation_max = 8.0
-        props.random_outline_irregularity_min = 0.0
-        props.random_outline_irregularity_max = 5.0
-        props.random_inner_asymmetry_min = 0.0
-        props.random_inner_asymmetry_max = 0.15
-        props.random_rim_variation_min = 0.0
-        props.random_rim_variation_max = 0.15
-        props.random_outer_edge_rounding_min = 0.0
-        props.random_outer_edge_rounding_max = 0.25
-        props.random_rim_edge_rounding_min = 0.0
-        props.random_rim_edge_rounding_max = 0.2
-        props.random_wall_angle_min = -10.0
-        props.random_wall_angle_max = 10.0
-        
-        # Reset rim variation
-        props.rim_height_variation = 0.0
-        props.rim_noise_scale = 3.0
         
         self.report({'INFO'}, "Settings reset to defaults")
         return {'FINISHED'}
@@ -1735,56 +1719,37 @@ class VIEW3D_PT_crater_generator(Panel):
         scene = context.scene
         props = scene.crater_properties
         
-        # Main generation buttons
+        # Label and value share one split row, and settings get no keyframe decorators
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+        
+        # Main generation buttons share one column scale; only Generate gets its own row
         col = layout.column(align=True)
+        col.scale_y = 1.5
         
-        # Regular crater button
+        # Regular crater button (row scale compounds with the column to 1.8)
         row = col.row()
-        row.scale_y = 1.8
-        op = row.operator(
+        row.scale_y = 1.2
+        row.operator(
             "mesh.add_crater", 
             text="Generate Clean Crater", 
             icon='OUTLINER_OB_META'
         )
-        # Pass current property values to the operator
-        op.outer_radius = props.outer_radius
-        op.inner_radius = props.inner_radius
-        op.depth = props.depth
-        op.rim_height = props.rim_height
-        op.resolution = props.resolution
-        op.noise_strength = props.noise_strength
-        op.outside_noise_strength = props.outside_noise_strength
-        op.create_materials = props.create_materials
-        op.auto_uv = props.auto_uv
-        op.optimize_for_games = props.optimize_for_games
-        op.close_bottom = props.close_bottom
-        op.center_origin = props.center_origin
-        op.bottom_thickness = props.bottom_thickness
-        op.outer_wall_angle = props.outer_wall_angle
-        op.inner_wall_angle = props.inner_wall_angle
-        op.rim_height_variation = props.rim_height_variation
-        op.rim_noise_scale = props.rim_noise_scale
-        op.blast_asymmetry = props.blast_asymmetry
-        op.edge_fragmentation = props.edge_fragmentation
-        op.inner_asymmetry = props.inner_asymmetry
-        op.crater_outline_irregularity = props.crater_outline_irregularity
-        op.rim_edge_rounding = props.rim_edge_rounding
-        op.outer_edge_rounding = props.outer_edge_rounding
-        op.center_origin_z_offset = props.center_origin_z_offset
-        
-        # Random crater button
-        row = col.row()
-        row.scale_y = 1.5
-        row.operator(
+        
+        # Random crater buttons
+        col.operator(
             "mesh.add_random_crater", 
             text="Random Crater", 
             icon='FILE_REFRESH'
         )
+        col.operator(
+            "mesh.add_crater_batch",
+            text="Random Batch",
+            icon='MOD_ARRAY'
+        )
         
         # Reset button
-        row = col.row()
-        row.scale_y = 1.2
-        row.operator(
+        col.operator(
             "mesh.reset_crater_settings",
             text="Reset to Defaults",
             icon='LOOP_BACK'
@@ -1864,8 +1829,10 @@ class VIEW3D_PT_crater_generator(Panel):
         col.prop(props, "edge_fragmentation")
         col.prop(props, "rim_edge_rounding")
         col.prop(props, "rim_height_variation")
-        if props.rim_height_variation > 0:
-            col.prop(props, "rim_noise_scale")
+        # Dependent settings stay visible but grayed out while unused
+        sub = col.column(align=True)
+        sub.active = props.rim_height_variation > 0
+        sub.prop(props, "rim_noise_scale")
         
         # Bottom/Wall Controls
         box = layout.box()
@@ -1873,8 +1840,9 @@ class VIEW3D_PT_crater_generator(Panel):
         
         col = box.column(align=True)
         col.prop(props, "close_bottom")
-        if props.close_bottom:
-            col.prop(props, "bottom_thickness")
+        sub = col.column(align=True)
+        sub.active = props.close_bottom
+        sub.prop(props, "bottom_thickness")
         col.prop(props, "outer_wall_angle")
         
         # Output Options
@@ -1886,12 +1854,24 @@ class VIEW3D_PT_crater_generator(Panel):
         col.prop(props, "auto_uv")
         col.prop(props, "optimize_for_games")
         col.prop(props, "center_origin")
-        if props.center_origin:
-            col.prop(props, "center_origin_z_offset")
+        sub = col.column(align=True)
+        sub.active = props.center_origin
+        sub.prop(props, "center_origin_z_offset")
+        col.prop(props, "random_seed")
         
-        # Random range controls - organized by feature groups
+        # Random range controls - organized by feature groups, collapsed by default
+        # so the dozens of range rows are only laid out while being edited
         box = layout.box()
-        box.label(text="Random Generation Ranges", icon='SETTINGS')
+        header = box.row()
+        header.use_property_split = False
+        header.prop(
+            props, "show_random_ranges",
+            icon='TRIA_DOWN' if props.show_random_ranges else 'TRIA_RIGHT',
+            emboss=False
+        )
+        if not props.show_random_ranges:
+            return
+        ranges = props.random
         
         # Basic dimensions
         sub_box = box.box()
@@ -1899,28 +1879,23 @@ class VIEW3D_PT_crater_generator(Panel):
         
         # Outer radius range
         row = sub_box.row(align=True)
-        row.prop(props, "random_outer_radius_min", text="Outer Radius Min")
-        row.prop(props, "random_outer_radius_max", text="Max")
+        row.prop(ranges, "outer_radius_range", text="Outer Radius")
         
         # Inner radius range
         row = sub_box.row(align=True)
-        row.prop(props, "random_inner_radius_min", text="Inner Radius Min")
-        row.prop(props, "random_inner_radius_max", text="Max")
+        row.prop(ranges, "inner_radius_range", text="Inner Radius")
         
         # Depth range  
         row = sub_box.row(align=True)
-        row.prop(props, "random_depth_min", text="Depth Min")
-        row.prop(props, "random_depth_max", text="Max")
+        row.prop(ranges, "depth_range", text="Depth")
         
         # Rim height range
-        row = sub_box.row(align=True) 
-        row.prop(props, "random_rim_height_min", text="Rim Height Min")
-        row.prop(props, "random_rim_height_max", text="Max")
+        row = sub_box.row(align=True)
+        row.prop(ranges, "rim_height_range", text="Rim Height")
         
         # Resolution range
         row = sub_box.row(align=True)
-        row.prop(props, "random_resolution_min", text="Resolution Min")
-        row.prop(props, "random_resolution_max", text="Max")
+        row.prop(ranges, "resolution_range", text="Resolution")
         
         # Surface detail
         sub_box = box.box()
@@ -1928,13 +1903,11 @@ class VIEW3D_PT_crater_generator(Panel):
         
         # Inside noise range
         row = sub_box.row(align=True)
-        row.prop(props, "random_noise_min", text="Inside Noise Min")
-        row.prop(props, "random_noise_max", text="Max")
+        row.prop(ranges, "noise_range", text="Inside Noise")
         
         # Outside noise range
         row = sub_box.row(align=True)
-        row.prop(props, "random_outside_noise_min", text="Outside Noise Min")
-        row.prop(props, "random_outside_noise_max", text="Max")
+        row.prop(ranges, "outside_noise_range", text="Outside Noise")
         
         # Explosion realism
         sub_box = box.box()
@@ -1942,23 +1915,19 @@ class VIEW3D_PT_crater_generator(Panel):
         
         # Blast asymmetry range
         row = sub_box.row(align=True)
-        row.prop(props, "random_blast_asymmetry_min", text="Blast Asymmetry Min")
-        row.prop(props, "random_blast_asymmetry_max", text="Max")
+        row.prop(ranges, "blast_asymmetry_range", text="Blast Asymmetry")
         
         # Outline irregularity range
         row = sub_box.row(align=True)
-        row.prop(props, "random_outline_irregularity_min", text="Outline Irregularity Min")
-        row.prop(props, "random_outline_irregularity_max", text="Max")
+        row.prop(ranges, "outline_irregularity_range", text="Outline Irregularity")
         
         # Edge fragmentation range
         row = sub_box.row(align=True)
-        row.prop(props, "random_edge_fragmentation_min", text="Edge Fragmentation Min") 
-        row.prop(props, "random_edge_fragmentation_max", text="Max")
+        row.prop(ranges, "edge_fragmentation_range", text="Edge Fragmentation")
         
         # Inner asymmetry range
         row = sub_box.row(align=True)
-        row.prop(props, "random_inner_asymmetry_min", text="Inner Asymmetry Min")
-        row.prop(props, "random_inner_asymmetry_max", text="Max")
+        row.prop(ranges, "inner_asymmetry_range", text="Inner Asymmetry")
         
         # Rim features
         sub_box = box.box()
@@ -1966,18 +1935,15 @@ class VIEW3D_PT_crater_generator(Panel):
         
         # Rim variation range
         row = sub_box.row(align=True)
-        row.prop(props, "random_rim_variation_min", text="Rim Variation Min")
-        row.prop(props, "random_rim_variation_max", text="Max")
+        row.prop(ranges, "rim_variation_range", text="Rim Variation")
         
         # Outer edge rounding range
         row = sub_box.row(align=True)
-        row.prop(props, "random_outer_edge_rounding_min", text="Outer Edge Rounding Min")
-        row.prop(props, "random_outer_edge_rounding_max", text="Max")
+        row.prop(ranges, "outer_edge_rounding_range", text="Outer Edge Rounding")
         
         # Rim edge rounding range
         row = sub_box.row(align=True)
-        row.prop(props, "random_rim_edge_rounding_min", text="Rim Edge Rounding Min")
-        row.prop(props, "random_rim_edge_rounding_max", text="Max")
+        row.prop(ranges, "rim_edge_rounding_range", text="Rim Edge Rounding")
         
         # Wall angles
         sub_box = box.box()
@@ -1985,8 +1951,7 @@ class VIEW3D_PT_crater_generator(Panel):
         
         # Wall angle range (shared for both inner and outer)
         row = sub_box.row(align=True)
-        row.prop(props, "random_wall_angle_min", text="Wall Angle Min")
-        row.prop(props, "random_wall_angle_max", text="Max")
+        row.prop(ranges, "wall_angle_range", text="Wall Angle")
 
 
 def menu_func(self, context):
@@ -1996,21 +1961,33 @@ def menu_func(self, context):
 
 # Registration
 classes = (
+    CraterRandomProperties,
     CraterProperties,
     MESH_OT_add_crater,
     MESH_OT_add_random_crater,
+    MESH_OT_add_crater_batch,
     MESH_OT_crater_create_firegeo_collision,
     MESH_OT_crater_create_lods,
     MESH_OT_reset_crater_settings,
     VIEW3D_PT_crater_generator,
 )
 
+# Registers in order and unregisters in reverse
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
     """Register all classes"""
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    # A reload that skipped unregister() leaves the previous import's classes
+    # registered under the same names; drop them so register_class succeeds
+    for cls in reversed(classes):
+        stale = getattr(bpy.types, cls.__name__, None)
+        if stale is not None:
+            bpy.utils.unregister_class(stale)
+    register_classes()
     
     bpy.types.Scene.crater_properties = PointerProperty(type=CraterProperties)
+    # remove() ignores a missing entry, so a repeated register() adds one menu item
+    bpy.types.VIEW3D_MT_mesh_add.remove(menu_func)
     bpy.types.VIEW3D_MT_mesh_add.append(menu_func)
 
 def unregister():
@@ -2019,8 +1996,7 @@ def unregister():
     if hasattr(bpy.types.Scene, 'crater_properties'):
         del bpy.types.Scene.crater_properties
     
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    unregister_classes()
 
 if __name__ == "__main__":
     register()